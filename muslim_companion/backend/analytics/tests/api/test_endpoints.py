@@ -212,3 +212,31 @@ class TestUserProfileEndpoint:
         assert response.status_code == status.HTTP_200_OK
         user.refresh_from_db()
         assert user.is_analytics_enabled is False
+
+    def test_profile_update_writes_only_submitted_columns(self, api_client, user):
+        """Test a partial profile update does not rewrite untouched columns."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from backend.users.models import UserProfile
+
+        UserProfile.objects.get_or_create(user=user)
+        api_client.force_authenticate(user=user)
+        url = reverse("api:user-profile")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.patch(
+                url,
+                {"preferred_language": "en"},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "users_userprofile"')
+        ]
+        assert len(updates) == 1
+        assert "preferred_language" in updates[0]
+        assert "timezone" not in updates[0]
@@ -1,5 +1,6 @@
 import pytest
 
+from backend.core.utils.retry import reset_circuit_breakers
 from backend.users.models import User
 from backend.users.tests.factories import UserFactory
 
@@ -9,6 +10,12 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers():
+    yield
+    reset_circuit_breakers()
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()
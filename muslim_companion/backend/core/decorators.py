@@ -94,13 +94,13 @@ def cache_response(
                 return Response(cached_data)
 
             # Cache MISS - execute view and cache result
-            logger.debug(f"Cache MISS: Executing view for key '{cache_key}'")
+            logger.debug("Cache MISS: Executing view for key '%s'", cache_key)
             response = view_func(request_or_self, *args, **kwargs)
 
             # Only cache successful responses
             if isinstance(response, Response) and response.status_code == 200:
                 cache_mgr.set(cache_key, response.data, ttl=ttl)
-                logger.debug(f"Cached response for key '{cache_key}' (TTL: {ttl}s)")
+                logger.debug("Cached response for key '%s' (TTL: %ss)", cache_key, ttl)
             else:
                 logger.debug(
                     f"Response not cached (status: {getattr(response, 'status_code', 'unknown')})",
@@ -274,11 +274,11 @@ class CachedModelMixin:
         # Try cache first
         cached_data = cache_mgr.get(cache_key)
         if cached_data is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
+            logger.debug("Cache HIT: %s", cache_key)
             return Response(cached_data)
 
         # Cache miss - fetch from database
-        logger.debug(f"Cache MISS: {cache_key}")
+        logger.debug("Cache MISS: %s", cache_key)
         response = super().retrieve(request, *args, **kwargs)  # type: ignore[misc]
 
         # Cache successful response
@@ -300,11 +300,11 @@ class CachedModelMixin:
         # Try cache first
         cached_data = cache_mgr.get(cache_key)
         if cached_data is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
+            logger.debug("Cache HIT: %s", cache_key)
             return Response(cached_data)
 
         # Cache miss - fetch from database
-        logger.debug(f"Cache MISS: {cache_key}")
+        logger.debug("Cache MISS: %s", cache_key)
         response = super().list(request, *args, **kwargs)  # type: ignore[misc]
 
         # Cache successful response with shorter TTL for lists
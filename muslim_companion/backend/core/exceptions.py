@@ -9,8 +9,6 @@ Implements AC #1-4, #7 from US-API-002:
 """
 
 import uuid
-from datetime import UTC
-from datetime import datetime
 
 from django.core.exceptions import PermissionDenied
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -25,9 +23,10 @@ from rest_framework.exceptions import PermissionDenied as DRFPermissionDenied
 from rest_framework.exceptions import Throttled
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework.response import Response
-from rest_framework.views import exception_handler as drf_exception_handler
+from rest_framework.views import set_rollback
 
 from backend.core.utils.abuse_detection import track_rate_limit_violation
+from backend.core.utils.timestamps import utc_timestamp
 
 STATUS_ERROR_500 = 500  # HTTP status code threshold for server errors
 DEFAULT_ERROR_MESSAGE = "Something went wrong. Please try again."
@@ -102,6 +101,17 @@ class TransientError(APIException):
     default_code = ErrorCodes.NETWORK_ERROR
 
 
+class CircuitOpenError(APIException):
+    """
+    Raised when a dependency's circuit breaker is open.
+    Calls fail fast instead of retrying against a service that keeps failing.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("Service temporarily unavailable. Please try again later.")
+    default_code = ErrorCodes.NETWORK_ERROR
+
+
 class RateLimitError(APIException):
     """Raised when rate limit is exceeded."""
 
@@ -162,7 +172,7 @@ def _get_identifier_from_request(request):
     # Get IP address (handle X-Forwarded-For for load balancers)
     x_forwarded_for = request.headers.get("x-forwarded-for")
     if x_forwarded_for:
-        return x_forwarded_for.split(",")[0].strip()
+        return x_forwarded_for.partition(",")[0].strip()
     return request.META.get("REMOTE_ADDR", "unknown")
 
 
@@ -207,7 +217,7 @@ def _handle_throttled_exception(exc, context):
             "details": {
                 "retry_after": retry_after,
             },
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "timestamp": utc_timestamp(),
             "request_id": request_id,
         },
     }
@@ -242,11 +252,36 @@ def _extract_error_message(exc):
         return _(DEFAULT_ERROR_MESSAGE)
 
     if isinstance(exc.detail, list):
-        return str(exc.detail[0]) if exc.detail else str(exc)
+        # str(exc) would only re-stringify the (empty) detail list
+        return str(exc.detail[0]) if exc.detail else _(DEFAULT_ERROR_MESSAGE)
 
     return str(exc.detail)
 
 
+# Map exception types to standardized error codes, resolved by walking the
+# exception's MRO so subclasses inherit their parent's code
+_ERROR_CODES_BY_EXCEPTION = {
+    DRFValidationError: ErrorCodes.VALIDATION_ERROR,
+    DjangoValidationError: ErrorCodes.VALIDATION_ERROR,
+    ValidationError: ErrorCodes.VALIDATION_ERROR,
+    NotAuthenticated: ErrorCodes.AUTH_ERROR,
+    AuthenticationFailed: ErrorCodes.AUTH_ERROR,
+    AuthenticationError: ErrorCodes.AUTH_ERROR,
+    PermissionDenied: ErrorCodes.AUTHORIZATION_ERROR,
+    DRFPermissionDenied: ErrorCodes.AUTHORIZATION_ERROR,
+    AuthorizationError: ErrorCodes.AUTHORIZATION_ERROR,
+    Http404: ErrorCodes.NOT_FOUND,
+    NotFound: ErrorCodes.NOT_FOUND,
+    ResourceNotFoundError: ErrorCodes.NOT_FOUND,
+    NetworkError: ErrorCodes.NETWORK_ERROR,
+    TransientError: ErrorCodes.NETWORK_ERROR,
+    CircuitOpenError: ErrorCodes.NETWORK_ERROR,
+    Throttled: ErrorCodes.RATE_LIMIT_EXCEEDED,
+    RateLimitError: ErrorCodes.RATE_LIMIT_EXCEEDED,
+}
+_get_error_code = _ERROR_CODES_BY_EXCEPTION.get
+
+
 def get_error_code_from_exception(exc):
     """
     Map exception types to standardized error codes.
@@ -257,32 +292,133 @@ def get_error_code_from_exception(exc):
     Returns:
         str: Error code constant
     """
-    # Map exception types to error codes
-    error_code_mapping = [
-        (
-            (DRFValidationError, DjangoValidationError, ValidationError),
-            ErrorCodes.VALIDATION_ERROR,
-        ),
-        (
-            (NotAuthenticated, AuthenticationFailed, AuthenticationError),
-            ErrorCodes.AUTH_ERROR,
-        ),
-        (
-            (PermissionDenied, DRFPermissionDenied, AuthorizationError),
-            ErrorCodes.AUTHORIZATION_ERROR,
-        ),
-        ((Http404, NotFound, ResourceNotFoundError), ErrorCodes.NOT_FOUND),
-        ((NetworkError, TransientError), ErrorCodes.NETWORK_ERROR),
-        ((Throttled, RateLimitError), ErrorCodes.RATE_LIMIT_EXCEEDED),
-    ]
-
-    for exception_types, error_code in error_code_mapping:
-        if isinstance(exc, exception_types):
+    for exception_type in type(exc).__mro__:
+        error_code = _get_error_code(exception_type)
+        if error_code is not None:
             return error_code
 
     return ErrorCodes.SERVER_ERROR
 
 
+def _build_error_response(exc, context, status_code, message, details):
+    """
+    Build the standardized error Response in a single pass.
+
+    Args:
+        exc: Exception instance (used to resolve the error code)
+        context: Request context
+        status_code: HTTP status code for the response
+        message: User-friendly error message
+        details: Error details dict
+
+    Returns:
+        Response: Standardized error response
+    """
+    request = context.get("request")
+
+    # Get request_id from request (set by ErrorHandlingMiddleware)
+    request_id = getattr(request, "request_id", str(uuid.uuid4()))
+
+    return Response(
+        {
+            "error": {
+                "code": get_error_code_from_exception(exc),
+                "message": message,
+                "details": details,
+                "timestamp": utc_timestamp(),
+                "request_id": request_id,
+            },
+        },
+        status=status_code,
+    )
+
+
+def _handle_api_exception(exc, context):
+    """
+    Handle DRF APIException subclasses.
+
+    Mirrors DRF's default handler (auth/retry headers, transaction rollback)
+    but produces the standardized payload directly.
+
+    Args:
+        exc: APIException instance
+        context: Request context
+
+    Returns:
+        Response: Standardized error response
+    """
+    set_rollback()
+
+    # For server errors (500), use generic message (AC #2)
+    if exc.status_code >= STATUS_ERROR_500:
+        message = _(DEFAULT_ERROR_MESSAGE)
+        details = {}  # Don't expose internal details
+    else:
+        message = _extract_error_message(exc)
+        # Include validation details for client errors
+        if isinstance(exc.detail, dict):
+            details = exc.detail
+        elif isinstance(exc.detail, list):
+            details = {}
+        else:
+            details = {"detail": exc.detail}
+
+    response = _build_error_response(
+        exc,
+        context,
+        exc.status_code,
+        message,
+        details,
+    )
+    if getattr(exc, "auth_header", None):
+        response["WWW-Authenticate"] = exc.auth_header
+    if getattr(exc, "wait", None):
+        response["Retry-After"] = str(int(exc.wait))
+    return response
+
+
+def _handle_django_not_found(exc, context):
+    """Translate Django's Http404 to DRF's NotFound."""
+    return _handle_api_exception(NotFound(*exc.args), context)
+
+
+def _handle_django_permission_denied(exc, context):
+    """Translate Django's PermissionDenied to DRF's PermissionDenied."""
+    return _handle_api_exception(DRFPermissionDenied(*exc.args), context)
+
+
+def _handle_server_error(exc, context):
+    """
+    Handle exceptions DRF doesn't know about with a generic 500 response.
+
+    Args:
+        exc: Exception instance
+        context: Request context
+
+    Returns:
+        Response: Standardized server error response
+    """
+    set_rollback()
+
+    return _build_error_response(
+        exc,
+        context,
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        _(DEFAULT_ERROR_MESSAGE),
+        {},  # Don't expose internal details (AC #2)
+    )
+
+
+# Dispatch table of exception handlers, resolved by walking the exception's MRO
+_EXCEPTION_HANDLERS = {
+    Throttled: _handle_throttled_exception,
+    Http404: _handle_django_not_found,
+    PermissionDenied: _handle_django_permission_denied,
+    APIException: _handle_api_exception,
+}
+_get_exception_handler = _EXCEPTION_HANDLERS.get
+
+
 def custom_exception_handler(exc, context):
     """
     Custom exception handler that returns standardized error responses.
@@ -298,6 +434,10 @@ def custom_exception_handler(exc, context):
     - Handles rate limit (429) responses with Retry-After header
     - Provides user-friendly localized rate limit messages
 
+    Exceptions are dispatched on type to a handler that builds the final
+    payload directly, rather than rewriting the response from DRF's default
+    exception handler.
+
     Returns errors in the format:
     {
         "error": {
@@ -309,50 +449,10 @@ def custom_exception_handler(exc, context):
         }
     }
     """
-    # Special handling for Throttled exceptions (US-API-005, AC #3, #4, #8)
-    if isinstance(exc, Throttled):
-        return _handle_throttled_exception(exc, context)
-
-    # Call DRF's default exception handler first
-    response = drf_exception_handler(exc, context)
+    for exception_type in type(exc).__mro__:
+        handler = _get_exception_handler(exception_type)
+        if handler is not None:
+            return handler(exc, context)
 
-    # If DRF didn't handle it, create a generic 500 response
-    if response is None:
-        response = Response(
-            {"detail": _(DEFAULT_ERROR_MESSAGE)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    # Get request from context
-    request = context.get("request")
-
-    # Get request_id from request (set by ErrorHandlingMiddleware)
-    request_id = getattr(request, "request_id", str(uuid.uuid4()))
-
-    # Get error code from exception type
-    error_code = get_error_code_from_exception(exc)
-
-    # Extract user-friendly message
-    message = _extract_error_message(exc)
-
-    # For server errors (500), use generic message (AC #2)
-    if response.status_code >= STATUS_ERROR_500:
-        message = _(DEFAULT_ERROR_MESSAGE)
-        details = {}  # Don't expose internal details
-    else:
-        # Include validation details for client errors
-        details = response.data if isinstance(response.data, dict) else {}
-
-    # Build standardized error response (AC #4)
-    standardized_response = {
-        "error": {
-            "code": error_code,
-            "message": message,
-            "details": details,
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-            "request_id": request_id,
-        },
-    }
-
-    response.data = standardized_response
-    return response
+    # Unknown exception types become a generic 500 response
+    return _handle_server_error(exc, context)
@@ -113,38 +113,38 @@ class SensitiveDataFilter(logging.Filter):
         re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
     ]
 
+    # Cheap pre-check so only arguments that could hold sensitive data are
+    # run through the full pattern set
+    SENSITIVE_KEYWORD_PATTERN = re.compile(
+        r"passw|pwd|token|jwt|bearer|authorization|@",
+        re.IGNORECASE,
+    )
+
     def filter(self, record):
         """
         Filter log record to remove sensitive data.
 
+        Scrubs both the message format string and any string arguments in
+        record.args, since "%s"-style arguments are only merged into the
+        message when the record is formatted.
+
         Args:
             record (LogRecord): Python logging LogRecord
 
         Returns:
             bool: True (always allow record through after scrubbing)
         """
-        # Scrub password fields from message
-        if hasattr(record, "msg"):
-            message = str(record.msg)
-            for pattern in self.PASSWORD_PATTERNS:
-                message = pattern.sub('"password":"***REDACTED***"', message)
-            record.msg = message
+        # Allow email in auth events (login, password reset) but not error logs
+        # Only filter emails from WARNING, ERROR, CRITICAL logs
+        scrub_emails = record.levelname not in ["INFO"]
 
-        # Scrub tokens and Authorization headers
+        # Scrub password fields, tokens and Authorization headers from message
         if hasattr(record, "msg"):
-            message = str(record.msg)
-            for pattern in self.TOKEN_PATTERNS:
-                message = pattern.sub('"token":"***REDACTED***"', message)
-            record.msg = message
+            record.msg = self._scrub(str(record.msg), scrub_emails=scrub_emails)
 
-        # Scrub email addresses from non-auth logs
-        # Allow email in auth events (login, password reset) but not error logs
-        if hasattr(record, "msg") and record.levelname not in ["INFO"]:
-            # Only filter emails from WARNING, ERROR, CRITICAL logs
-            message = str(record.msg)
-            for pattern in self.EMAIL_PATTERNS:
-                message = pattern.sub("***EMAIL_REDACTED***", message)
-            record.msg = message
+        # Scrub the same patterns from "%s"-style message arguments
+        if record.args:
+            record.args = self._scrub_args(record.args, scrub_emails=scrub_emails)
 
         # Scrub sensitive fields from extra context
         if hasattr(record, "password"):
@@ -156,3 +156,46 @@ class SensitiveDataFilter(logging.Filter):
 
         # Always allow record through (after scrubbing)
         return True
+
+    def _scrub(self, message, *, scrub_emails):
+        """
+        Redact sensitive patterns from a string.
+
+        Args:
+            message (str): Text to scrub
+            scrub_emails (bool): Whether to redact email addresses as well
+
+        Returns:
+            str: Scrubbed text
+        """
+        for pattern in self.PASSWORD_PATTERNS:
+            message = pattern.sub('"password":"***REDACTED***"', message)
+        for pattern in self.TOKEN_PATTERNS:
+            message = pattern.sub('"token":"***REDACTED***"', message)
+        if scrub_emails:
+            for pattern in self.EMAIL_PATTERNS:
+                message = pattern.sub("***EMAIL_REDACTED***", message)
+        return message
+
+    def _scrub_args(self, args, *, scrub_emails):
+        """
+        Redact sensitive patterns from string log arguments.
+
+        Args:
+            args (tuple | dict): record.args (a dict for mapping-style formatting)
+
+        Returns:
+            tuple | dict: Arguments with sensitive strings scrubbed
+        """
+        if isinstance(args, dict):
+            return {
+                key: self._scrub_arg(value, scrub_emails=scrub_emails)
+                for key, value in args.items()
+            }
+        return tuple(self._scrub_arg(arg, scrub_emails=scrub_emails) for arg in args)
+
+    def _scrub_arg(self, arg, *, scrub_emails):
+        """Scrub a single log argument if it is a string with sensitive keywords."""
+        if isinstance(arg, str) and self.SENSITIVE_KEYWORD_PATTERN.search(arg):
+            return self._scrub(arg, scrub_emails=scrub_emails)
+        return arg
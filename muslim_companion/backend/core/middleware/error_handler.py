@@ -8,18 +8,19 @@ Implements AC #2, #6, #8 from US-API-002:
 - Enrich Sentry context with request and user info
 """
 
+import json
 import logging
 import uuid
-from datetime import UTC
-from datetime import datetime
 
 import redis
 import sentry_sdk
 from django.conf import settings
 from django.db import transaction
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.utils.translation import gettext as _
 
+from backend.core.utils.timestamps import utc_timestamp
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,7 +92,7 @@ class ErrorHandlingMiddleware:
             exception: Raised exception
 
         Returns:
-            JsonResponse with standardized error format
+            HttpResponse with standardized JSON error format
         """
         # Get request_id (should be set in __call__, but fallback just in case)
         request_id = getattr(request, "request_id", str(uuid.uuid4()))
@@ -117,36 +118,34 @@ class ErrorHandlingMiddleware:
             return None
 
         # Log to Sentry with full context (AC #8)
-        # Enrich context with request info
-        sentry_sdk.set_tag("request_id", request_id)
-        sentry_sdk.set_context(
-            "request",
-            {
-                "url": request.build_absolute_uri(),
-                "method": request.method,
-                "headers": self._get_safe_headers(request),
-                "query_params": dict(request.GET),
+        # Context is passed as scope kwargs so the event is built and serialized
+        # once, then handed to the SDK's background transport, instead of
+        # mutating the shared scope several times before capturing.
+        sentry_context = {
+            "tags": {
+                "request_id": request_id,
+                "environment": getattr(settings, "ENVIRONMENT", "unknown"),
             },
-        )
+            "contexts": {
+                "request": {
+                    "url": request.build_absolute_uri(),
+                    "method": request.method,
+                    "headers": self._get_safe_headers(request),
+                    "query_params": dict(request.GET),
+                },
+            },
+        }
 
         # Add user context if authenticated
         if hasattr(request, "user") and request.user.is_authenticated:
-            sentry_sdk.set_user(
-                {
-                    "id": request.user.id,
-                    "email": request.user.email,
-                    "username": request.user.username,
-                },
-            )
-
-        # Add environment info
-        sentry_sdk.set_tag(
-            "environment",
-            settings.ENVIRONMENT if hasattr(settings, "ENVIRONMENT") else "unknown",
-        )
+            sentry_context["user"] = {
+                "id": request.user.id,
+                "email": request.user.email,
+                "username": request.user.username,
+            }
 
         # Capture exception to Sentry
-        sentry_sdk.capture_exception(exception)
+        sentry_sdk.capture_exception(exception, **sentry_context)
 
         # Ensure database transaction rollback (AC #6)
         if transaction.get_connection().in_atomic_block:
@@ -172,12 +171,18 @@ class ErrorHandlingMiddleware:
                 "code": "SERVER_ERROR",
                 "message": _("Something went wrong. Please try again."),
                 "details": {},
-                "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+                "timestamp": utc_timestamp(),
                 "request_id": request_id,
             },
         }
 
-        return JsonResponse(error_response, status=500)
+        # The payload only holds plain strings, so serialize it directly instead
+        # of going through JsonResponse's DjangoJSONEncoder
+        return HttpResponse(
+            json.dumps(error_response, separators=(",", ":")),
+            content_type="application/json",
+            status=500,
+        )
 
     def _get_safe_headers(self, request):
         """
@@ -194,7 +194,7 @@ class RequestLoggingMiddleware:
         if x_forwarded_for:
             # X-Forwarded-For can contain multiple IPs (client, proxy1, proxy2, ...)
             # First IP is the original client
-            ip = x_forwarded_for.split(",")[0].strip()
+            ip = x_forwarded_for.partition(",")[0].strip()
         else:
             ip = request.META.get("REMOTE_ADDR", "unknown")
         return ip
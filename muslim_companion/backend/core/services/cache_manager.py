@@ -61,9 +61,9 @@ class CacheManager:
         try:
             value = self._cache.get(key)
             if value is not None:
-                logger.debug(f"Cache HIT: {key}")
+                logger.debug("Cache HIT: %s", key)
             else:
-                logger.debug(f"Cache MISS: {key}")
+                logger.debug("Cache MISS: %s", key)
             return value
         except redis.exceptions.RedisError as e:
             logger.warning(f"Cache GET error for key '{key}': {e}")
@@ -86,7 +86,7 @@ class CacheManager:
         """
         try:
             self._cache.set(key, value, timeout=ttl)
-            logger.debug(f"Cache SET: {key} (TTL: {ttl or 'default'})")
+            logger.debug("Cache SET: %s (TTL: %s)", key, ttl or "default")
             return True
         except (redis.exceptions.RedisError, TypeError) as e:
             logger.warning(f"Cache SET error for key '{key}': {e}")
@@ -107,7 +107,7 @@ class CacheManager:
         """
         try:
             result = self._cache.delete(key)
-            logger.debug(f"Cache DELETE: {key} (deleted: {result})")
+            logger.debug("Cache DELETE: %s (deleted: %s)", key, result)
             return result > 0
         except redis.exceptions.RedisError as e:
             logger.warning(f"Cache DELETE error for key '{key}': {e}")
@@ -178,7 +178,7 @@ class CacheManager:
         """
         try:
             result = self._cache.has_key(key)
-            logger.debug(f"Cache EXISTS: {key} = {result}")
+            logger.debug("Cache EXISTS: %s = %s", key, result)
             return result
         except redis.exceptions.RedisError as e:
             logger.warning(f"Cache EXISTS error for key '{key}': {e}")
@@ -203,7 +203,7 @@ class CacheManager:
             result = self._cache.get_many(keys)
             hit_count = len(result)
             miss_count = len(keys) - hit_count
-            logger.debug(f"Cache GET_MANY: {hit_count} hits, {miss_count} misses")
+            logger.debug("Cache GET_MANY: %s hits, %s misses", hit_count, miss_count)
             return result
         except redis.exceptions.RedisError as e:
             logger.warning(f"Cache GET_MANY error: {e}")
@@ -227,7 +227,11 @@ class CacheManager:
         """
         try:
             self._cache.set_many(data, timeout=ttl)
-            logger.debug(f"Cache SET_MANY: {len(data)} keys (TTL: {ttl or 'default'})")
+            logger.debug(
+                "Cache SET_MANY: %s keys (TTL: %s)",
+                len(data),
+                ttl or "default",
+            )
             return True
         except (redis.exceptions.RedisError, TypeError) as e:
             logger.warning(f"Cache SET_MANY error: {e}")
@@ -13,12 +13,16 @@ Tests AC #1-9 from US-API-002:
 - Consistent error handling across endpoints
 """
 
+import asyncio
 import time
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from celery.exceptions import Retry
 from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
+from django.http import Http404
 from django.test import RequestFactory
 from rest_framework import status
 from rest_framework.exceptions import AuthenticationFailed
@@ -28,6 +32,7 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework.test import APIClient
 from rest_framework.test import APIRequestFactory
 
+from backend.core.exceptions import CircuitOpenError
 from backend.core.exceptions import ErrorCodes
 from backend.core.exceptions import NetworkError
 from backend.core.exceptions import TransientError
@@ -35,6 +40,7 @@ from backend.core.exceptions import ValidationError
 from backend.core.exceptions import custom_exception_handler
 from backend.core.exceptions import get_error_code_from_exception
 from backend.core.middleware.error_handler import ErrorHandlingMiddleware
+from backend.core.utils.retry import no_jitter
 from backend.core.utils.retry import retry_with_exponential_backoff
 
 User = get_user_model()
@@ -95,6 +101,27 @@ class TestCustomExceptionHandler:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data["error"]["code"] == ErrorCodes.NOT_FOUND
 
+    def test_django_http404_returns_404(self):
+        """Test AC #1: Django Http404 is translated to a standardized 404."""
+        exc = Http404("Missing")
+        context = {"request": self.request}
+
+        response = custom_exception_handler(exc, context)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["error"]["code"] == ErrorCodes.NOT_FOUND
+        assert response.data["error"]["message"] == "Missing"
+
+    def test_django_permission_denied_returns_403(self):
+        """Test AC #1: Django PermissionDenied is translated to a standardized 403."""
+        exc = DjangoPermissionDenied()
+        context = {"request": self.request}
+
+        response = custom_exception_handler(exc, context)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["error"]["code"] == ErrorCodes.AUTHORIZATION_ERROR
+
     def test_server_error_returns_500_without_stack_trace(self):
         """Test AC #2: Server errors return 500 with generic message, no stack trace."""
         exc = Exception("Internal database error occurred")
@@ -186,8 +213,11 @@ class TestErrorMiddleware:
 
         response = self.middleware.process_exception(request, exception)
 
-        # Verify Sentry capture_exception was called
-        mock_capture.assert_called_once_with(exception)
+        # Verify Sentry capture_exception was called once with pre-filled context
+        mock_capture.assert_called_once()
+        assert mock_capture.call_args.args == (exception,)
+        assert mock_capture.call_args.kwargs["tags"]["request_id"] == "test-id"
+        assert mock_capture.call_args.kwargs["user"]["id"] == "user-123"
         # Verify response is standardized error format
         assert response.status_code == 500
         import json
@@ -218,7 +248,11 @@ class TestRetryLogic:
         """Test AC #5: Transient errors trigger exponential backoff retry."""
         call_count = {"count": 0}
 
-        @retry_with_exponential_backoff(max_retries=3, delays=(0.01, 0.02, 0.03))
+        @retry_with_exponential_backoff(
+            max_retries=3,
+            delays=(0.01, 0.02, 0.03),
+            jitter=no_jitter,
+        )
         def flaky_function():
             call_count["count"] += 1
             if call_count["count"] < 3:
@@ -250,6 +284,136 @@ class TestRetryLogic:
         # 1 initial attempt + 2 retries = 3 total calls
         assert call_count["count"] == 3
 
+    def test_zero_retries_returns_function_unwrapped(self):
+        """Test AC #5: Disabling retries leaves the function undecorated."""
+
+        def fetch():
+            return "data"
+
+        assert retry_with_exponential_backoff(max_retries=0)(fetch) is fetch
+
+    @patch("backend.core.utils.retry.time.sleep")
+    def test_retry_delays_are_jittered(self, mock_sleep):
+        """Test AC #5: Retry delays are randomized within the backoff schedule."""
+
+        @retry_with_exponential_backoff(max_retries=3, delays=(1.0, 2.0, 4.0))
+        def always_fail():
+            raise TransientError
+
+        with pytest.raises(TransientError):
+            always_fail()
+
+        slept = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(slept) == 3
+        for delay, base_delay in zip(slept, (1.0, 2.0, 4.0), strict=True):
+            assert 0 <= delay <= base_delay
+
+    @patch("backend.core.utils.retry.time.sleep")
+    def test_async_retry_does_not_block_event_loop(self, mock_sleep):
+        """Test AC #5: Coroutines are retried with asyncio.sleep, not time.sleep."""
+        call_count = {"count": 0}
+
+        @retry_with_exponential_backoff(max_retries=2, delays=(0.01, 0.01))
+        async def flaky_operation():
+            call_count["count"] += 1
+            if call_count["count"] < 3:
+                raise TransientError
+            return "success"
+
+        assert asyncio.run(flaky_operation()) == "success"
+        assert call_count["count"] == 3
+        mock_sleep.assert_not_called()
+
+    def test_retries_stop_when_max_time_spent(self):
+        """Test AC #5: The max_time budget bounds the total retry latency."""
+        call_count = {"count": 0}
+
+        @retry_with_exponential_backoff(
+            max_retries=3,
+            delays=(0.05, 1.0, 1.0),
+            jitter=no_jitter,
+            max_time=0.1,
+        )
+        def always_fail():
+            call_count["count"] += 1
+            raise TransientError
+
+        start_time = time.time()
+        with pytest.raises(TransientError):
+            always_fail()
+        elapsed = time.time() - start_time
+
+        # Second delay was shortened to the budget; no third retry started
+        assert call_count["count"] == 3
+        assert elapsed < 0.5
+
+    @patch("backend.core.utils.retry.time.sleep")
+    @patch("backend.core.utils.retry.current_task")
+    def test_celery_task_retried_through_broker(self, mock_task, mock_sleep):
+        """Test AC #5: Celery task bodies are re-queued instead of sleeping."""
+        call_count = {"count": 0}
+
+        @retry_with_exponential_backoff(max_retries=3, jitter=no_jitter)
+        def task_body():
+            call_count["count"] += 1
+            raise TransientError
+
+        mock_task.request.called_directly = False
+        mock_task.request.is_eager = False
+        mock_task.request.retries = 1
+        mock_task.run = task_body
+        mock_task.retry.return_value = Retry()
+
+        with pytest.raises(Retry):
+            task_body()
+
+        assert call_count["count"] == 1
+        mock_sleep.assert_not_called()
+        mock_task.retry.assert_called_once()
+        assert mock_task.retry.call_args.kwargs["countdown"] == 2.0
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        """Test AC #5: Repeated exhausted retries open the circuit and fail fast."""
+        call_count = {"count": 0}
+
+        @retry_with_exponential_backoff(
+            max_retries=1,
+            delays=(0.01,),
+            breaker_threshold=2,
+            breaker_reset_timeout=0.05,
+        )
+        def dependency_call(*, fail=True):
+            call_count["count"] += 1
+            if fail:
+                raise NetworkError
+            return "success"
+
+        for _ in range(2):
+            with pytest.raises(NetworkError):
+                dependency_call()
+        assert call_count["count"] == 4
+
+        # Circuit is open: fail fast without calling the dependency
+        with pytest.raises(CircuitOpenError):
+            dependency_call()
+        assert call_count["count"] == 4
+
+        # After the reset timeout a probe call goes through and closes the circuit
+        time.sleep(0.06)
+        assert dependency_call(fail=False) == "success"
+        assert dependency_call(fail=False) == "success"
+
+    def test_circuit_breaker_disabled_by_default(self):
+        """Test AC #5: Without breaker_threshold, failures never open a circuit."""
+
+        @retry_with_exponential_backoff(max_retries=1, delays=(0.0,))
+        def dependency_call():
+            raise NetworkError
+
+        for _ in range(10):
+            with pytest.raises(NetworkError):
+                dependency_call()
+
     def test_non_retryable_errors_fail_immediately(self):
         """Test AC #5: Non-retryable errors don't trigger retry logic."""
         call_count = {"count": 0}
@@ -14,11 +14,18 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
+from django.db import connections
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from backend.core.views.main import CELERY_WORKERS_CACHE_KEY
+from backend.core.views.main import _check_database
+from backend.core.views.main import _check_disk
 
-@pytest.mark.django_db
+
+@pytest.mark.django_db(databases=["default", "health"])
 class TestHealthCheckEndpoint:
     """Test health check endpoint functionality."""
 
@@ -40,12 +47,13 @@ class TestHealthCheckEndpoint:
         assert data["checks"]["celery"]["status"] in ["up", "down"]
         assert data["checks"]["disk"]["status"] in ["ok", "low"]
 
-    @patch("backend.core.views.main.connection")
-    def test_returns_503_when_database_down(self, mock_connection):
+    @patch("backend.core.views.main.connections")
+    def test_returns_503_when_database_down(self, mock_connections):
         """Test health check returns 503 when database is unavailable."""
         # Mock database connection failure
         mock_cursor = MagicMock()
         mock_cursor.execute.side_effect = Exception("Database unavailable")
+        mock_connection = mock_connections.__getitem__.return_value
         mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
 
         client = Client()
@@ -78,8 +86,9 @@ class TestHealthCheckEndpoint:
     def test_returns_503_when_no_celery_workers(self, mock_celery):
         """Test health check returns 503 when no Celery workers are active."""
         # Mock no active workers
+        cache.delete(CELERY_WORKERS_CACHE_KEY)
         mock_inspect = MagicMock()
-        mock_inspect.stats.return_value = None  # No workers
+        mock_inspect.ping.return_value = None  # No workers
         mock_celery.control.inspect.return_value = mock_inspect
 
         client = Client()
@@ -92,6 +101,68 @@ class TestHealthCheckEndpoint:
         assert data["checks"]["celery"]["status"] == "down"
         assert data["checks"]["celery"]["workers"] == 0
 
+    @patch("backend.core.views.main.current_app")
+    def test_celery_worker_count_cached(self, mock_celery):
+        """Test the Celery worker count is cached between health checks."""
+        cache.delete(CELERY_WORKERS_CACHE_KEY)
+        mock_inspect = MagicMock()
+        mock_inspect.ping.return_value = {"celery@worker1": {"ok": "pong"}}
+        mock_celery.control.inspect.return_value = mock_inspect
+
+        client = Client()
+        url = reverse("health-check")
+
+        client.get(url)
+        response = client.get(url)
+
+        data = response.json()
+        assert data["checks"]["celery"] == {"status": "up", "workers": 1}
+        # Only the first health check pinged the workers
+        assert mock_inspect.ping.call_count == 1
+        cache.delete(CELERY_WORKERS_CACHE_KEY)
+
+    @patch("backend.core.views.main.HEALTH_CHECK_TIMEOUT_SECONDS", 0.1)
+    @patch("backend.core.views.main._check_celery")
+    def test_slow_check_reported_as_timeout(self, mock_check_celery):
+        """Test a check exceeding the deadline is reported as timed out."""
+        mock_check_celery.side_effect = lambda: time.sleep(0.5) or ("up", 1)
+
+        client = Client()
+        url = reverse("health-check")
+
+        start_time = time.time()
+        response = client.get(url)
+        elapsed_time = time.time() - start_time
+
+        assert response.status_code == 503
+        data = response.json()
+        assert data["checks"]["celery"]["status"] == "timeout"
+        assert data["checks"]["celery"]["workers"] == 0
+        # Other checks ran concurrently and still reported their results
+        assert data["checks"]["database"]["status"] == "up"
+        assert elapsed_time < 0.5
+
+    def test_database_check_runs_through_health_alias(self):
+        """Test SELECT 1 succeeds with the health alias's connection settings."""
+        with CaptureQueriesContext(connections["health"]) as health_queries:
+            status, latency_ms = _check_database()
+
+        assert status == "up"
+        assert latency_ms >= 0
+        assert [query["sql"] for query in health_queries] == ["SELECT 1"]
+
+    @patch("backend.core.views.main.shutil.disk_usage")
+    def test_disk_usage_cached_between_checks(self, mock_disk_usage):
+        """Test disk usage is reused between health checks for a few seconds."""
+        mock_disk_usage.return_value = MagicMock(total=100, free=50)
+
+        with patch("backend.core.views.main._disk_check_result", (None, 0.0)):
+            first = _check_disk()
+            second = _check_disk()
+
+        assert first == second == ("ok", 50.0)
+        assert mock_disk_usage.call_count == 1
+
     def test_completes_in_under_one_second(self):
         """Test health check completes in < 1 second (with small tolerance for test overhead)."""
         client = Client()
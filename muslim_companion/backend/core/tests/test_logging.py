@@ -161,6 +161,44 @@ class TestSensitiveDataFilter:
         # Token should be redacted
         assert "***REDACTED***" in str(record.msg)
 
+    def test_passwords_in_args_not_logged(self):
+        """Test passwords passed as %s-style arguments are scrubbed."""
+        sensitive_filter = SensitiveDataFilter()
+
+        record = logging.LogRecord(
+            name="backend.test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Login attempt: %s (%d)",
+            args=("password=secretpass123", 1),
+            exc_info=None,
+        )
+
+        sensitive_filter.filter(record)
+
+        assert "secretpass123" not in record.getMessage()
+        assert "***REDACTED***" in record.getMessage()
+
+    def test_emails_in_args_scrubbed_from_warnings(self):
+        """Test email addresses passed as arguments are scrubbed from warnings."""
+        sensitive_filter = SensitiveDataFilter()
+
+        record = logging.LogRecord(
+            name="backend.test",
+            level=logging.WARNING,
+            pathname="test.py",
+            lineno=1,
+            msg="Lookup failed for %s",
+            args=("test@example.com",),
+            exc_info=None,
+        )
+
+        sensitive_filter.filter(record)
+
+        assert "test@example.com" not in record.getMessage()
+        assert "***EMAIL_REDACTED***" in record.getMessage()
+
 
 @pytest.mark.django_db
 class TestRequestLoggingMiddleware:
@@ -13,15 +13,29 @@ Tests AC #1-9:
 - Rate limit status visible to users
 """
 
+import time
+from unittest.mock import ANY
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+import redis
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.test import override_settings
 from rest_framework import status
+from rest_framework.request import Request
 from rest_framework.test import APIClient
-
+from rest_framework.test import APIRequestFactory
+
+from backend.core.throttling import GCRA_SCRIPT
+from backend.core.throttling import AnonRateThrottle
+from backend.core.throttling import get_rate_limit_whitelist
+from backend.core.throttling import reset_local_throttle_blocks
+from backend.core.utils.abuse_detection import VIOLATION_COUNT_SCRIPT
+from backend.core.utils.abuse_detection import VIOLATION_WINDOW_SECONDS
 from backend.core.utils.abuse_detection import track_rate_limit_violation
+from backend.users.api.throttling import AuthEndpointThrottle
 
 User = get_user_model()
 
@@ -50,12 +64,25 @@ def authenticated_client(api_client, authenticated_user):
     return api_client
 
 
+def exhaust_rate_limit(ident="127.0.0.1", scope="anon", limit=20, duration=60):
+    """
+    Exhaust a rate limit by prefilling its fixed-window throttle counter.
+
+    Much faster than sending `limit` real requests through the full DRF stack;
+    the next request for the same client is throttled.
+    """
+    window = int(time.time() // duration)
+    cache.set(f"throttle_{scope}_{ident}:{window}", limit, timeout=duration)
+
+
 @pytest.fixture(autouse=True)
 def _clear_cache():
     """Clear cache before each test to ensure clean state."""
     cache.clear()
+    reset_local_throttle_blocks()
     yield
     cache.clear()
+    reset_local_throttle_blocks()
 
 
 @pytest.mark.django_db
@@ -117,10 +144,8 @@ class TestAnonymousRateLimiting:
         url = "/api/v1/analytics/consent/"
 
         # Exhaust rate limit
-        for _ in range(25):
-            response = api_client.post(url, {"consent_given": True}, format="json")
-            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-                break
+        exhaust_rate_limit()
+        response = api_client.post(url, {"consent_given": True}, format="json")
 
         # Verify Retry-After header
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -134,10 +159,8 @@ class TestAnonymousRateLimiting:
         url = "/api/v1/analytics/consent/"
 
         # Exhaust rate limit
-        for _ in range(25):
-            response = api_client.post(url, {"consent_given": True}, format="json")
-            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-                break
+        exhaust_rate_limit()
+        response = api_client.post(url, {"consent_given": True}, format="json")
 
         # Verify error response format
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -185,12 +208,10 @@ class TestAuthenticatedRateLimiting:
 
         url = "/api/v1/analytics/consent/"
 
-        # Exhaust user1's rate limit
+        # Exhaust user1's rate limit (100 req/min)
         api_client.force_authenticate(user=user1)
-        for _ in range(105):  # Exceed 100 req/min limit
-            response = api_client.post(url, {"consent_given": True}, format="json")
-            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-                break
+        exhaust_rate_limit(ident=user1.pk, scope="user", limit=100)
+        response = api_client.post(url, {"consent_given": True}, format="json")
 
         # User1 should be throttled
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -222,7 +243,7 @@ class TestRateLimitWhitelist:
             response = api_client.post(url, {"consent_given": True}, format="json")
             assert response.status_code != status.HTTP_429_TOO_MANY_REQUESTS
 
-    @patch("backend.core.throttling.settings.RATE_LIMIT_WHITELIST", ["127.0.0.1"])
+    @override_settings(RATE_LIMIT_WHITELIST=["127.0.0.1"])
     def test_whitelisted_ip_bypasses_rate_limit(self, api_client):
         """Test whitelisted IP addresses bypass rate limits (AC #7)."""
         url = "/api/v1/analytics/consent/"
@@ -234,6 +255,104 @@ class TestRateLimitWhitelist:
             # May not be throttled if IP matches whitelist
             # This test verifies the whitelist logic in throttle classes
 
+    def test_whitelist_rebuilt_when_setting_changes(self):
+        """Test cached whitelist follows RATE_LIMIT_WHITELIST overrides (AC #7)."""
+        with override_settings(RATE_LIMIT_WHITELIST=["10.0.0.1"]):
+            assert "10.0.0.1" in get_rate_limit_whitelist()
+
+        assert "10.0.0.1" not in get_rate_limit_whitelist()
+
+
+class TestLocalThrottleBlocks:
+    """Test in-process memory of recent throttle rejections."""
+
+    def test_rejection_reused_without_cache_lookup(self):
+        """Test a throttled client stays blocked locally without the cache."""
+
+        class TwoPerMinuteThrottle(AnonRateThrottle):
+            rate = "2/min"
+
+        request = Request(APIRequestFactory().get("/api/v1/test/"))
+
+        assert TwoPerMinuteThrottle().allow_request(request, None)
+        assert TwoPerMinuteThrottle().allow_request(request, None)
+        assert not TwoPerMinuteThrottle().allow_request(request, None)
+
+        # The cached counter is gone, but the rejection is remembered locally
+        cache.clear()
+        throttle = TwoPerMinuteThrottle()
+        assert not throttle.allow_request(request, None)
+        assert 0 < throttle.wait() <= 60
+
+        reset_local_throttle_blocks()
+        assert TwoPerMinuteThrottle().allow_request(request, None)
+
+
+class TestGCRAThrottle:
+    """Test the Redis GCRA path against a mocked Redis client."""
+
+    class TwentyPerMinuteThrottle(AnonRateThrottle):
+        rate = "20/min"
+
+    @pytest.fixture
+    def redis_client(self):
+        client = MagicMock()
+        with patch(
+            "backend.core.throttling.get_redis_client",
+            return_value=client,
+        ):
+            yield client
+
+    def test_rate_evaluated_with_one_script_call(self, redis_client):
+        """Test the GCRA script gets the key, emission interval and burst."""
+        redis_client.eval.return_value = [1, 0]
+        request = Request(APIRequestFactory().get("/api/v1/test/"))
+
+        assert self.TwentyPerMinuteThrottle().allow_request(request, None)
+        redis_client.eval.assert_called_once_with(
+            GCRA_SCRIPT,
+            1,
+            cache.make_key("throttle_anon_127.0.0.1"),
+            ANY,
+            3000,
+            60000,
+        )
+
+    def test_rejection_uses_script_retry_after(self, redis_client):
+        """Test a rejected request waits for the delay the script returned."""
+        redis_client.eval.return_value = [0, 1500]
+        request = Request(APIRequestFactory().get("/api/v1/test/"))
+        throttle = self.TwentyPerMinuteThrottle()
+
+        assert not throttle.allow_request(request, None)
+        assert throttle.wait() == 2
+
+    def test_redis_error_allows_request(self, redis_client):
+        """Test requests are not blocked when Redis is unavailable."""
+        redis_client.eval.side_effect = redis.exceptions.ConnectionError
+        request = Request(APIRequestFactory().get("/api/v1/test/"))
+
+        assert self.TwentyPerMinuteThrottle().allow_request(request, None)
+
+
+class TestAuthEndpointThrottle:
+    """Test the 5/min throttle guarding authentication endpoints."""
+
+    def test_sixth_request_in_window_rejected(self):
+        """Test the auth throttle allows five requests per minute."""
+        request = Request(APIRequestFactory().get("/api/v1/auth/login/"))
+
+        for _ in range(5):
+            assert AuthEndpointThrottle().allow_request(request, None)
+        assert not AuthEndpointThrottle().allow_request(request, None)
+
+    def test_counted_separately_from_anonymous_limit(self):
+        """Test the global anonymous limit does not consume the auth budget."""
+        exhaust_rate_limit()
+        request = Request(APIRequestFactory().get("/api/v1/auth/login/"))
+
+        assert AuthEndpointThrottle().allow_request(request, None)
+
 
 @pytest.mark.django_db
 class TestAbuseDetection:
@@ -258,6 +377,22 @@ class TestAbuseDetection:
         call_args = mock_sentry.capture_message.call_args
         assert "threshold exceeded" in call_args[0][0].lower()
 
+    @patch("backend.core.utils.abuse_detection.sentry_sdk")
+    def test_violations_reported_to_sentry_on_transitions(self, mock_sentry):
+        """Test only first, power-of-two and threshold violations reach Sentry (AC #8)."""
+        user_id = "test_user_sampled"
+        endpoint = "/api/test/"
+
+        # Violations 1-7: reported at 1, 2 and 4
+        for _ in range(7):
+            track_rate_limit_violation(user_id, endpoint)
+        assert mock_sentry.capture_message.call_count == 3
+
+        # Violations 8-11: reported at 8 and at the threshold crossing (10)
+        for _ in range(4):
+            track_rate_limit_violation(user_id, endpoint)
+        assert mock_sentry.capture_message.call_count == 5
+
     def test_violation_counter_increments(self):
         """Test violation counter increments correctly (AC #8)."""
         user_id = "test_user_456"
@@ -293,6 +428,60 @@ class TestAbuseDetection:
         result = track_rate_limit_violation(user_id, endpoint)
         assert result["violation_count"] == 1
 
+    def test_violation_counter_ttl_set_once(self):
+        """Test the 1-hour window is not extended by later violations (AC #8)."""
+        user_id = "test_user_ttl"
+        endpoint = "/api/test/"
+        cache_key = f"rate_violations:{user_id}:hour"
+
+        with patch(
+            "backend.core.utils.abuse_detection.cache",
+            wraps=cache,
+        ) as mock_cache:
+            for _ in range(3):
+                track_rate_limit_violation(user_id, endpoint)
+
+        mock_cache.add.assert_called_once_with(
+            cache_key,
+            0,
+            timeout=VIOLATION_WINDOW_SECONDS,
+        )
+        mock_cache.set.assert_not_called()
+        assert cache.get(cache_key) == 3
+
+    def test_violation_counted_with_one_script_call_on_redis(self):
+        """Test Redis violations are counted by one script call (AC #8)."""
+        redis_client = MagicMock()
+        redis_client.eval.return_value = 3
+
+        with patch(
+            "backend.core.utils.abuse_detection.get_redis_client",
+            return_value=redis_client,
+        ):
+            result = track_rate_limit_violation("test_user_redis", "/api/test/")
+
+        assert result["violation_count"] == 3
+        redis_client.eval.assert_called_once_with(
+            VIOLATION_COUNT_SCRIPT,
+            1,
+            cache.make_key("rate_violations:test_user_redis:hour"),
+            VIOLATION_WINDOW_SECONDS,
+        )
+        redis_client.pipeline.assert_not_called()
+
+    def test_violation_tracking_degrades_when_redis_unavailable(self):
+        """Test a Redis error counts the violation as the first (AC #8)."""
+        redis_client = MagicMock()
+        redis_client.eval.side_effect = redis.exceptions.ConnectionError
+
+        with patch(
+            "backend.core.utils.abuse_detection.get_redis_client",
+            return_value=redis_client,
+        ):
+            result = track_rate_limit_violation("test_user_down", "/api/test/")
+
+        assert result["violation_count"] == 1
+
 
 @pytest.mark.django_db
 class TestRateLimitIntegration:
@@ -303,15 +492,14 @@ class TestRateLimitIntegration:
         url = "/api/v1/analytics/consent/"
 
         # Exhaust rate limit
-        for _ in range(25):
-            response = api_client.post(url, {"consent_given": True}, format="json")
-            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-                break
+        exhaust_rate_limit()
+        response = api_client.post(url, {"consent_given": True}, format="json")
 
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
 
         # Clear cache to simulate window reset (in real scenario, would wait 60 seconds)
         cache.clear()
+        reset_local_throttle_blocks()
 
         # Should be able to make requests again
         response = api_client.post(url, {"consent_given": True}, format="json")
@@ -340,10 +528,8 @@ class TestRateLimitIntegration:
         url = "/api/v1/analytics/consent/"
 
         # Exhaust rate limit
-        for _ in range(25):
-            response = api_client.post(url, {"consent_given": True}, format="json")
-            if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-                break
+        exhaust_rate_limit()
+        response = api_client.post(url, {"consent_given": True}, format="json")
 
         # English (default)
         data = response.json()
@@ -1,16 +1,250 @@
 """Custom throttling classes for API rate limiting (US-API-005)."""
 
+import functools
+import logging
+import math
+import time
+from collections import OrderedDict
+
+import redis
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from rest_framework.throttling import AnonRateThrottle as DRFAnonRateThrottle
 from rest_framework.throttling import UserRateThrottle as DRFUserRateThrottle
 
+from backend.core.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+NS_PER_MS = 1_000_000
+NS_PER_SECOND = 1_000_000_000
+
+# Generic Cell Rate Algorithm (GCRA) evaluated atomically in Redis.
+# Stores a single "theoretical arrival time" (TAT, in ms) per key instead of a
+# list of request timestamps.
+# KEYS[1]: throttle key
+# ARGV[1]: now (ms), ARGV[2]: emission interval (ms), ARGV[3]: burst offset (ms)
+# Returns {allowed (1/0), retry_after (ms)}
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local emission_interval = tonumber(ARGV[2])
+local burst_offset = tonumber(ARGV[3])
+local tat = tonumber(redis.call("GET", KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + emission_interval
+local allow_at = new_tat - burst_offset
+if allow_at > now then
+    return {0, allow_at - now}
+end
+redis.call("SET", KEYS[1], new_tat, "PX", new_tat - now)
+return {1, 0}
+"""
+
+
+# Per-process memory of recent throttle rejections (see LocalBlockMixin):
+# throttle key -> (local expiry, retry-at), both on the monotonic clock
+LOCAL_BLOCK_MAX_SECONDS = 1.0
+LOCAL_BLOCK_MAX_ENTRIES = 10_000
+_local_blocks = OrderedDict()
+
+
+def reset_local_throttle_blocks():
+    """Forget all locally remembered throttle rejections (used by tests)."""
+    _local_blocks.clear()
+
+
+@functools.cache
+def get_rate_limit_whitelist():
+    """
+    Return RATE_LIMIT_WHITELIST as a frozenset for O(1) membership checks.
+
+    Built once instead of scanning the settings list on every request.
+    """
+    return frozenset(settings.RATE_LIMIT_WHITELIST)
+
+
+@receiver(setting_changed)
+def _reset_rate_limit_whitelist(*, setting, **kwargs):
+    """Rebuild the whitelist when RATE_LIMIT_WHITELIST is overridden (tests)."""
+    if setting == "RATE_LIMIT_WHITELIST":
+        get_rate_limit_whitelist.cache_clear()
+
+
+class RequestIdentMixin:
+    """
+    Resolve the client identifier once per request.
+
+    The whitelist check and the cache key both need the client IP, and with
+    both throttles installed DRF would parse X-Forwarded-For for each of them.
+    The identifier is stored on the request and reused by every throttle.
+    """
+
+    def get_ident(self, request):
+        """Return the cached client identifier, resolving it on first use."""
+        ident = getattr(request, "_throttle_ident", None)
+        if ident is None:
+            ident = super().get_ident(request)
+            request._throttle_ident = ident  # noqa: SLF001
+        return ident
+
+
+class LocalBlockMixin:
+    """
+    Remember throttle rejections in-process for up to a second.
+
+    A client that keeps hammering the API after being throttled would cost a
+    cache round-trip per rejected request. Once a request is rejected, the
+    decision is reused locally for min(Retry-After, 1s), so a flooding client
+    costs roughly one cache round-trip per second per process. The memory is
+    bounded, evicting the oldest entries first.
+    """
+
+    def allow_request(self, request, view):
+        """Reject locally while a recent rejection is remembered."""
+        key = self.get_cache_key(request, view) if self.rate is not None else None
+        if key is None:
+            return super().allow_request(request, view)
+
+        now = time.monotonic()
+        block = _local_blocks.get(key)
+        if block is not None:
+            local_expiry, retry_at = block
+            if local_expiry > now:
+                self.retry_after = retry_at - now
+                return False
+            _local_blocks.pop(key, None)
+
+        if super().allow_request(request, view):
+            return True
+
+        retry_after = self.wait()
+        if retry_after:
+            _local_blocks[key] = (
+                now + min(retry_after, LOCAL_BLOCK_MAX_SECONDS),
+                now + retry_after,
+            )
+            if len(_local_blocks) > LOCAL_BLOCK_MAX_ENTRIES:
+                _local_blocks.popitem(last=False)
+        return False
+
+
+class GCRAThrottleMixin:
+    """
+    Evaluate DRF rate limits with GCRA in a single Redis round-trip.
+
+    DRF's SimpleRateThrottle reads a list of request timestamps from the cache,
+    filters it in Python and writes it back: O(limit) work, two round-trips and
+    a lost-update race between concurrent requests. GCRA keeps one timestamp
+    per key and updates it atomically in a Lua script, which also yields an
+    exact Retry-After.
+
+    Falls back to the next throttle in the MRO (FixedWindowThrottleMixin) when
+    the cache is not django-redis (e.g. the local-memory cache used in tests).
+    """
+
+    def allow_request(self, request, view):
+        """Check the rate limit with GCRA when the cache is backed by Redis."""
+        redis_client = get_redis_client(self.cache)
+        if redis_client is None:
+            return super().allow_request(request, view)
+
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        period_ms = self.duration * 1000
+        now_ms = time.time_ns() // NS_PER_MS
+        try:
+            allowed, retry_after_ms = redis_client.eval(
+                GCRA_SCRIPT,
+                1,
+                self.cache.make_key(self.key),
+                now_ms,
+                max(1, period_ms // self.num_requests),
+                period_ms,
+            )
+        except redis.exceptions.RedisError:
+            # Graceful degradation: don't block requests if Redis is unavailable
+            logger.warning("Rate limit check skipped: Redis unavailable", exc_info=True)
+            return True
+
+        self.retry_after = retry_after_ms / 1000
+        return bool(allowed)
+
+
+class FixedWindowThrottleMixin:
+    """
+    Evaluate DRF rate limits with a fixed-window counter.
+
+    Used for cache backends without Redis scripting. Instead of DRF's list of
+    request timestamps (O(limit) bytes and list work per request, rewritten
+    with a racy get/set), each client gets one integer counter per window,
+    incremented atomically with cache.incr(). For per-minute limits the
+    behaviour is equivalent, and Retry-After is simply the time left in the
+    current window.
+    """
+
+    def allow_request(self, request, view):
+        """Count the request in the current window and check it against the limit."""
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        # Integer nanoseconds: no float rounding at the edge of a window
+        now_ns = time.time_ns()
+        period_ns = self.duration * NS_PER_SECOND
+        window = now_ns // period_ns
+        window_key = f"{self.key}:{window}"
+        try:
+            request_count = self.cache.incr(window_key)
+        except ValueError:
+            # First request of the window: add() sets the TTL exactly once
+            self.cache.add(window_key, 0, timeout=self.duration)
+            request_count = self.cache.incr(window_key)
+
+        # incr() returns None if the cache is unavailable (IGNORE_EXCEPTIONS)
+        if request_count is not None and request_count > self.num_requests:
+            self.retry_after = ((window + 1) * period_ns - now_ns) / NS_PER_SECOND
+            return False
+        return True
+
+    def wait(self):
+        """
+        Return the number of seconds until the next request is allowed.
+
+        Computed in O(1) from the window instead of DRF's scan of the request
+        history: the time left in the current window, or the exact delay
+        recorded by allow_request().
+        """
+        retry_after = getattr(self, "retry_after", None)
+        if retry_after is None:
+            period_ns = self.duration * NS_PER_SECOND
+            retry_after = (period_ns - time.time_ns() % period_ns) / NS_PER_SECOND
+        return math.ceil(retry_after)
+
 
-class AnonRateThrottle(DRFAnonRateThrottle):
+class AnonRateThrottle(
+    RequestIdentMixin,
+    LocalBlockMixin,
+    GCRAThrottleMixin,
+    FixedWindowThrottleMixin,
+    DRFAnonRateThrottle,
+):
     """
     Rate limiting for anonymous users (AC #2).
 
     Limits anonymous users to 20 requests per minute per IP address.
-    Uses Redis cache for distributed rate tracking.
+    Uses Redis (GCRA) for distributed rate tracking, or a fixed-window
+    counter on other cache backends.
 
     Cache key format: throttle_anon_{ip_address}
     Rate: 20 requests per minute per IP
@@ -38,18 +272,25 @@ class AnonRateThrottle(DRFAnonRateThrottle):
 
         # Check if IP is whitelisted (AC #7)
         ip_address = self.get_ident(request)
-        if ip_address in settings.RATE_LIMIT_WHITELIST:
+        if ip_address in get_rate_limit_whitelist():
             return True
 
         return super().allow_request(request, view)
 
 
-class UserRateThrottle(DRFUserRateThrottle):
+class UserRateThrottle(
+    RequestIdentMixin,
+    LocalBlockMixin,
+    GCRAThrottleMixin,
+    FixedWindowThrottleMixin,
+    DRFUserRateThrottle,
+):
     """
     Rate limiting for authenticated users (AC #2).
 
     Limits authenticated users to 100 requests per minute per user ID.
-    Uses Redis cache for distributed rate tracking.
+    Uses Redis (GCRA) for distributed rate tracking, or a fixed-window
+    counter on other cache backends.
 
     Cache key format: throttle_user_{user_id}
     Rate: 100 requests per minute per user
@@ -80,8 +321,9 @@ class UserRateThrottle(DRFUserRateThrottle):
             if request.user.is_staff or request.user.is_superuser:
                 return True
 
-            # Check if user ID is whitelisted
-            if str(request.user.id) in settings.RATE_LIMIT_WHITELIST:
+            # Check if user ID is whitelisted (skip str() when the list is empty)
+            whitelist = get_rate_limit_whitelist()
+            if whitelist and str(request.user.id) in whitelist:
                 return True
 
         return super().allow_request(request, view)
@@ -2,19 +2,37 @@
 
 import logging
 
+import redis
 import sentry_sdk
 from django.conf import settings
 from django.core.cache import cache
 
+from backend.core.utils.redis_client import get_redis_client
+
 logger = logging.getLogger(__name__)
 
+VIOLATION_WINDOW_SECONDS = 3600  # Violations are counted per 1-hour window
+
+# Count a violation, starting the window's TTL on the first one.
+# KEYS[1]: violation counter key
+# ARGV[1]: window (seconds)
+# Returns the violation count including this violation
+VIOLATION_COUNT_SCRIPT = """
+local count = redis.call("INCR", KEYS[1])
+if count == 1 then
+    redis.call("EXPIRE", KEYS[1], ARGV[1])
+end
+return count
+"""
+
 
 def track_rate_limit_violation(user_id_or_ip, endpoint, context=None):
     """
     Track rate limit violation and detect abuse patterns (AC #8).
 
-    Logs violations to Sentry, increments violation counter in Redis,
-    and triggers alerts for repeat offenders (10+ violations per hour).
+    Increments violation counter in Redis, logs violations (reported to
+    Sentry on state transitions), and triggers alerts for repeat offenders
+    (10+ violations per hour).
 
     Args:
         user_id_or_ip: User ID (authenticated) or IP address (anonymous)
@@ -32,9 +50,32 @@ def track_rate_limit_violation(user_id_or_ip, endpoint, context=None):
     cache_key = f"rate_violations:{user_id_or_ip}:hour"
 
     # Increment violation counter
-    violation_count = cache.get(cache_key, 0)
-    violation_count += 1
-    cache.set(cache_key, violation_count, timeout=3600)  # 1 hour TTL
+    violation_count = _increment_violation_count(cache_key)
+
+    threshold = settings.RATE_LIMIT_ABUSE_THRESHOLD
+    threshold_exceeded = violation_count >= threshold
+    result = {
+        "violation_count": violation_count,
+        "threshold_exceeded": threshold_exceeded,
+        "threshold": threshold,
+    }
+
+    if not threshold_exceeded:
+        # Regular violation logging (info level)
+        logger.info(
+            "Rate limit violation: %s on %s (count: %d/%d)",
+            user_id_or_ip,
+            endpoint,
+            violation_count,
+            threshold,
+        )
+
+    # Sentry alerts (and the critical log) are only emitted on state
+    # transitions: the first violation, every power-of-two count and the
+    # threshold crossing. An abusive client produces O(log n) reports per
+    # window instead of one per throttled request.
+    if not _is_reported_violation(violation_count, threshold):
+        return result
 
     # Log to Sentry with full context
     with sentry_sdk.push_scope() as scope:
@@ -47,20 +88,20 @@ def track_rate_limit_violation(user_id_or_ip, endpoint, context=None):
                 "user_id_or_ip": user_id_or_ip,
                 "endpoint": endpoint,
                 "violation_count": violation_count,
-                "threshold": settings.RATE_LIMIT_ABUSE_THRESHOLD,
+                "threshold": threshold,
                 **context,
             },
         )
 
         # Check if threshold exceeded (10+ violations per hour)
-        if violation_count >= settings.RATE_LIMIT_ABUSE_THRESHOLD:
+        if threshold_exceeded:
             # Critical alert for repeat offenders
             logger.critical(
                 "Rate limit abuse detected: %s exceeded threshold "
                 "(%d violations in 1 hour, threshold: %d)",
                 user_id_or_ip,
                 violation_count,
-                settings.RATE_LIMIT_ABUSE_THRESHOLD,
+                threshold,
             )
             sentry_sdk.capture_message(
                 f"Rate limit abuse threshold exceeded: {user_id_or_ip}",
@@ -72,24 +113,68 @@ def track_rate_limit_violation(user_id_or_ip, endpoint, context=None):
             # ban_key = f"rate_ban:{user_id_or_ip}"
             # cache.set(ban_key, True, timeout=settings.RATE_LIMIT_BAN_DURATION)
         else:
-            # Regular violation logging (info level)
-            logger.info(
-                "Rate limit violation: %s on %s (count: %d/%d)",
-                user_id_or_ip,
-                endpoint,
-                violation_count,
-                settings.RATE_LIMIT_ABUSE_THRESHOLD,
-            )
             sentry_sdk.capture_message(
                 f"Rate limit violation: {user_id_or_ip}",
                 level="info",
             )
 
-    return {
-        "violation_count": violation_count,
-        "threshold_exceeded": violation_count >= settings.RATE_LIMIT_ABUSE_THRESHOLD,
-        "threshold": settings.RATE_LIMIT_ABUSE_THRESHOLD,
-    }
+    return result
+
+
+def _is_reported_violation(violation_count, threshold):
+    """
+    Check whether a violation count is a state transition worth alerting on.
+
+    Args:
+        violation_count: Violation count including the current violation
+        threshold: Abuse threshold (violations per hour)
+
+    Returns:
+        bool: True for the threshold crossing and power-of-two counts
+    """
+    is_power_of_two = (violation_count & (violation_count - 1)) == 0
+    return violation_count == threshold or is_power_of_two
+
+
+def _increment_violation_count(cache_key):
+    """
+    Atomically increment the violation counter for the current window.
+
+    On Redis, a Lua script runs INCR and, for the first violation of the
+    window, EXPIRE: one round-trip per violation, atomic with respect to
+    concurrent violations, and the TTL is never extended. (EXPIRE NX would
+    need Redis 7; the script works on any server with scripting.)
+
+    Other backends use cache.incr(), which is atomic on memcached as well and
+    keeps the key's TTL. Only the first violation of a window pays for the
+    add() + incr() pair; add() sets the TTL exactly once and is a no-op for
+    concurrent first violations. The counter is never rewritten with set().
+
+    Args:
+        cache_key: Violation counter cache key
+
+    Returns:
+        int: Violation count including this violation
+    """
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        try:
+            return redis_client.eval(
+                VIOLATION_COUNT_SCRIPT,
+                1,
+                cache.make_key(cache_key),
+                VIOLATION_WINDOW_SECONDS,
+            )
+        except redis.exceptions.RedisError:
+            # Graceful degradation: tracking is best-effort if Redis is unavailable
+            logger.warning("Rate limit violation not counted: Redis unavailable")
+            return 1
+
+    try:
+        return cache.incr(cache_key) or 1
+    except ValueError:
+        cache.add(cache_key, 0, timeout=VIOLATION_WINDOW_SECONDS)
+        return cache.incr(cache_key) or 1
 
 
 def is_temporarily_banned(user_id_or_ip):
@@ -0,0 +1,24 @@
+"""Access to the raw Redis client behind the django-redis cache backend."""
+
+from django.core.cache import cache
+
+
+def get_redis_client(cache_backend=cache):
+    """
+    Return the redis-py client behind a django-redis cache backend.
+
+    Used for operations the Django cache API can't express in one round-trip
+    (pipelines, Lua scripts). Backends without a Redis client, such as the
+    local-memory cache used in tests, return None so callers can fall back to
+    the portable cache API.
+
+    Args:
+        cache_backend: Django cache backend (default: the default cache)
+
+    Returns:
+        redis.Redis | None: Redis client, or None for non-Redis backends
+    """
+    client = getattr(cache_backend, "client", None)
+    if client is None or not hasattr(client, "get_client"):
+        return None
+    return client.get_client(write=True)
@@ -3,22 +3,30 @@ Retry logic with exponential backoff for transient errors.
 
 Implements AC #5 from US-API-002:
 - Automatic retry for transient errors
-- Exponential backoff (1s, 2s, 4s)
+- Exponential backoff (1s, 2s, 4s caps), with full jitter by default: each
+  sleep is random in [0, delay]; pass jitter=no_jitter for the exact schedule
 - Max 3 retry attempts
 - User informed of retry progress
 - Only idempotent operations
 """
 
+import asyncio
 import functools
+import inspect
 import logging
+import random
+import threading
 import time
+import weakref
 from typing import TYPE_CHECKING
 
 import redis
 import requests
+from celery import current_task
 from django.db import OperationalError
 from django_redis.exceptions import ConnectionInterrupted
 
+from backend.core.exceptions import CircuitOpenError
 from backend.core.exceptions import NetworkError
 from backend.core.exceptions import TransientError
 
@@ -28,22 +36,148 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def retry_with_exponential_backoff(
+# Jitter strategies: map a backoff delay to the delay actually slept
+def full_jitter(delay: float) -> float:
+    """Sleep anywhere between 0 and the backoff delay (AWS "full jitter")."""
+    return random.uniform(0, delay)  # noqa: S311
+
+
+def equal_jitter(delay: float) -> float:
+    """Sleep at least half the backoff delay, randomizing the other half."""
+    return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
+
+
+def no_jitter(delay: float) -> float:
+    """Sleep exactly the backoff delay."""
+    return delay
+
+
+class _CircuitBreaker:
+    """
+    Per-decoration circuit breaker (closed -> open -> half-open -> closed).
+
+    Opens after `threshold` consecutive calls that still failed after all
+    retries, then fails fast with CircuitOpenError for `reset_timeout`
+    seconds instead of running another full retry chain against a dead
+    dependency. After the timeout a single probe call is let through:
+    success closes the circuit, failure opens it again.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "failures",
+        "lock",
+        "opened_at",
+        "reset_timeout",
+        "state",
+        "threshold",
+    )
+
+    def __init__(self, threshold, reset_timeout):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self.state = "closed"
+        self.lock = threading.Lock()
+
+    def before_call(self, func_name):
+        """Raise CircuitOpenError unless the call may go through."""
+        if self.state == "closed":
+            return
+        with self.lock:
+            if self.state == "closed":
+                return
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError
+            # Let one probe through; restarting the timer means a probe that
+            # never reports back can't hold the circuit half-open forever
+            self.state = "half_open"
+            self.opened_at = now
+        logger.info("Circuit half-open for %s: allowing a probe call", func_name)
+
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        if self.state == "closed" and not self.failures:
+            return
+        with self.lock:
+            self.failures = 0
+            self.state = "closed"
+
+    def record_failure(self, func_name):
+        """Count a call that failed after all retries, opening the circuit."""
+        with self.lock:
+            self.failures += 1
+            if self.state != "half_open" and self.failures < self.threshold:
+                return
+            self.state = "open"
+            self.opened_at = time.monotonic()
+        logger.error(
+            "Circuit opened for %s after %d consecutive failures; "
+            "failing fast for %.1f s",
+            func_name,
+            self.failures,
+            self.reset_timeout,
+        )
+
+
+# Live circuit breakers, so tests can close them all between runs
+_circuit_breakers: weakref.WeakSet[_CircuitBreaker] = weakref.WeakSet()
+
+
+def _new_circuit_breaker(threshold, reset_timeout):
+    breaker = _CircuitBreaker(threshold, reset_timeout)
+    _circuit_breakers.add(breaker)
+    return breaker
+
+
+def reset_circuit_breakers():
+    """Close all circuit breakers (used by tests)."""
+    for breaker in list(_circuit_breakers):
+        breaker.record_success()
+
+
+def retry_with_exponential_backoff(  # noqa: PLR0913
     max_retries: int = 3,
     delays: tuple[float, ...] = (1.0, 2.0, 4.0),
     exceptions: tuple[type[Exception], ...] = (TransientError, NetworkError),
+    jitter: Callable[[float], float] = full_jitter,
+    breaker_threshold: int | None = None,
+    breaker_reset_timeout: float = 30.0,
+    max_time: float | None = None,
 ):
     """
     Decorator to retry function calls with exponential backoff.
 
-    Implements AC #5: Automatic retry for transient errors with delays of 1s, 2s, 4s.
-    Logs each retry attempt and informs user of progress.
+    Implements AC #5: Automatic retry for transient errors with exponential
+    backoff. The delays (1s, 2s, 4s by default) are upper bounds: with the
+    default full_jitter each sleep is random in [0, delay], so clients that
+    failed together don't retry in lockstep. Pass jitter=no_jitter to sleep
+    exactly 1s, 2s, 4s. Logs each retry attempt and informs user of progress.
+
+    Coroutine functions are supported: their delays use asyncio.sleep() so the
+    event loop keeps serving other tasks during backoff. When the decorated
+    function is the body of a Celery task running in a worker, retries are
+    re-queued with task.retry(countdown=...) instead of sleeping, releasing
+    the worker slot during backoff.
 
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
-        delays: Tuple of delay durations in seconds for each retry (default: (1, 2, 4))
+        delays: Tuple of maximum delays in seconds for each retry, before
+            jitter (default: (1, 2, 4))
         exceptions: Tuple of exception types to retry on "
         "(default: (TransientError, NetworkError))
+        jitter: Function mapping each backoff delay to the delay actually slept,
+            so clients failing together don't retry in lockstep
+            (default: full_jitter; also equal_jitter, no_jitter)
+        breaker_threshold: Consecutive failed calls (after all retries) that
+            open the function's circuit breaker (default: None, no breaker)
+        breaker_reset_timeout: Seconds an open circuit fails fast with
+            CircuitOpenError before a probe call is allowed (default: 30)
+        max_time: Time budget in seconds for retrying after the first failure
+            (delays + retry attempts); no retry starts once it is spent and
+            delays are shortened to fit it (default: None, no budget)
 
     Usage:
         @retry_with_exponential_backoff()
@@ -57,91 +191,282 @@ def retry_with_exponential_backoff(
         Decorated function with retry logic
     """
 
+    # Delay for each retry, resolved once (use last delay if we exceed the tuple)
+    retry_delays = tuple(
+        delays[min(retry_index, len(delays) - 1)] for retry_index in range(max_retries)
+    )
+    schedule = _RetrySchedule(retry_delays, jitter, max_time)
+
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            attempts = 0
+        # Nothing to retry: skip the wrapper entirely
+        if max_retries <= 0:
+            return func
+        breaker = None
+        if breaker_threshold is not None:
+            breaker = _new_circuit_breaker(breaker_threshold, breaker_reset_timeout)
+        if inspect.iscoroutinefunction(func):
+            return _async_retry_wrapper(func, exceptions, schedule, breaker)
+        return _retry_wrapper(func, exceptions, schedule, breaker)
+
+    return decorator
+
+
+def _retry_wrapper(func, exceptions, schedule, breaker):
+    """Wrap a regular function with retry logic (delays block the thread)."""
+    func_name = func.__name__
+
+    def retry(args, kwargs, exc):
+        """Slow path: retry after the first attempt failed with exc."""
+        # Celery task bodies are re-queued instead (raises if that applies)
+        _retry_celery_task(func, exc, schedule, breaker)
+
+        # Time spent retrying (delays + retry attempts), measured with the
+        # monotonic clock so it is immune to wall-clock adjustments
+        retry_start = time.monotonic()
+        retries = 0
+        for retry_num, delay in schedule.attempts(func_name, exc, retry_start):
+            retries = retry_num
+            # Wait before retrying
+            time.sleep(delay)
 
-            # First attempt (not a retry)
+            # Attempt the function call
+            try:
+                result = func(*args, **kwargs)
+            except exceptions as retry_exc:
+                exc = retry_exc
+                _log_retry_failed(func_name, retry_num, schedule.max_retries, exc)
+                # Continue to next retry attempt
+            else:
+                # Success! Log and return
+                _log_retry_succeeded(func_name, retry_num, retry_start)
+                return result
+
+        # All retries exhausted
+        _log_retries_exhausted(func_name, retries, retry_start, exc)
+        if breaker is not None:
+            breaker.record_failure(func_name)
+        raise exc
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if breaker is None:
+            # Fast path: first attempt (not a retry) with no retry state to set up
             try:
                 return func(*args, **kwargs)
             except exceptions as exc:
-                last_exception = exc
-                attempts = 1
-                logger.info(
-                    "Function %s failed on first attempt: %s. "
-                    "Will retry up to %d times.",
-                    func.__name__,
-                    exc,
-                    max_retries,
-                )
+                return retry(args, kwargs, exc)
+
+        breaker.before_call(func_name)
+        try:
+            result = func(*args, **kwargs)
+        except exceptions as exc:
+            result = retry(args, kwargs, exc)
+        breaker.record_success()
+        return result
+
+    return wrapper
+
 
-            # Retry attempts
-            for retry_num in range(1, max_retries + 1):
-                # Get delay for this retry (use last delay if we exceed the tuple)
-                delay = delays[min(retry_num - 1, len(delays) - 1)]
+def _async_retry_wrapper(func, exceptions, schedule, breaker):
+    """Wrap a coroutine function with retry logic (delays yield to the loop)."""
+    func_name = func.__name__
 
-                # Log retry attempt
+    async def retry(args, kwargs, exc):
+        """Slow path: retry after the first attempt failed with exc."""
+        retry_start = time.monotonic()
+        retries = 0
+        for retry_num, delay in schedule.attempts(func_name, exc, retry_start):
+            retries = retry_num
+            # Wait without blocking the event loop
+            await asyncio.sleep(delay)
+
+            try:
+                result = await func(*args, **kwargs)
+            except exceptions as retry_exc:
+                exc = retry_exc
+                _log_retry_failed(func_name, retry_num, schedule.max_retries, exc)
+            else:
+                _log_retry_succeeded(func_name, retry_num, retry_start)
+                return result
+
+        _log_retries_exhausted(func_name, retries, retry_start, exc)
+        if breaker is not None:
+            breaker.record_failure(func_name)
+        raise exc
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if breaker is not None:
+            breaker.before_call(func_name)
+        try:
+            result = await func(*args, **kwargs)
+        except exceptions as exc:
+            result = await retry(args, kwargs, exc)
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    return wrapper
+
+
+def _current_celery_task(func):
+    """Return the Celery task running func as its body in a worker, if any."""
+    task = current_task
+    if not task or task.request.called_directly or task.request.is_eager:
+        return None
+    # Only the task's own body can be retried by re-queueing the task; a
+    # decorated helper called from a task is retried in-process
+    if getattr(task.run, "__wrapped__", None) is not func:
+        return None
+    return task
+
+
+def _retry_celery_task(func, exc, schedule, breaker):
+    """
+    Retry a Celery task through the broker instead of sleeping in the worker.
+
+    task.retry() re-queues the task with the backoff delay as its countdown,
+    so the worker slot runs other tasks during backoff instead of blocking.
+    Returns without doing anything unless func is the running task's body;
+    otherwise always raises: Celery's Retry, or exc once retries run out.
+    """
+    task = _current_celery_task(func)
+    if task is None:
+        return
+
+    func_name = func.__name__
+    retries = task.request.retries
+    if retries < schedule.max_retries:
+        delay = schedule.jitter(schedule.delays[retries])
+        logger.info(
+            "Rescheduling task %s (retry %d/%d) in %.2f s: %s",
+            func_name,
+            retries + 1,
+            schedule.max_retries,
+            delay,
+            exc,
+        )
+        raise task.retry(exc=exc, countdown=delay, max_retries=schedule.max_retries)
+
+    logger.error(
+        "Task %s failed after %d total attempts (1 initial + %d retries). "
+        "Raising last exception.",
+        func_name,
+        retries + 1,
+        retries,
+        exc_info=exc,
+    )
+    if breaker is not None:
+        breaker.record_failure(func_name)
+    raise exc
+
+
+class _RetrySchedule:
+    """Backoff delays for a decorated function, with jitter and a time budget."""
+
+    __slots__ = ("delays", "jitter", "max_retries", "max_time")
+
+    def __init__(self, delays, jitter, max_time):
+        self.delays = delays
+        self.jitter = jitter
+        self.max_retries = len(delays)
+        self.max_time = max_time
+
+    def attempts(self, func_name, exc, retry_start):
+        """
+        Log the first failure, then yield (retry_num, delay) for each retry.
+
+        With a max_time budget, retries stop once the budget is spent and each
+        delay is shortened to the time left.
+        """
+        deadline = None if self.max_time is None else retry_start + self.max_time
+        # Resolved once per retry chain rather than once per log call
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Function %s failed on first attempt: %s. Will retry up to %d times.",
+                func_name,
+                exc,
+                self.max_retries,
+            )
+
+        for retry_num, base_delay in enumerate(self.delays, start=1):
+            delay = self.jitter(base_delay)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Retry time budget of %.2f s spent for %s; giving up",
+                        self.max_time,
+                        func_name,
+                    )
+                    return
+                delay = min(delay, remaining)
+
+            # Log retry attempt
+            if log_info:
                 logger.info(
-                    "Retrying %s... (attempt %d/%d) after %s s delay",
-                    func.__name__,
+                    "Retrying %s... (attempt %d/%d) after %.2f s delay",
+                    func_name,
                     retry_num,
-                    max_retries,
+                    self.max_retries,
                     delay,
                 )
+            yield retry_num, delay
 
-                # Wait before retrying
-                time.sleep(delay)
-
-                # Attempt the function call
-                try:
-                    result = func(*args, **kwargs)
-                    # Success! Log and return
-                    logger.info(
-                        "Function %s succeeded on attempt %d (after %d retries)",
-                        func.__name__,
-                        retry_num + 1,
-                        retry_num,
-                    )
-                    return result
-                except exceptions as exc:
-                    last_exception = exc
-                    attempts = retry_num + 1
-                    logger.warning(
-                        "Retry %d/%d failed for %s: %s",
-                        retry_num,
-                        max_retries,
-                        func.__name__,
-                        exc,
-                    )
-                    # Continue to next retry attempt
-
-            # All retries exhausted
-            logger.error(
-                "Function %s failed after %d total attempts (1 initial + %d retries). "
-                "Raising last exception.",
-                func.__name__,
-                attempts,
-                max_retries,
-            )
-            raise last_exception
 
-        return wrapper
+def _log_retry_failed(func_name, retry_num, max_retries, exc):
+    logger.warning(
+        "Retry %d/%d failed for %s: %s",
+        retry_num,
+        max_retries,
+        func_name,
+        exc,
+    )
 
-    return decorator
+
+def _log_retry_succeeded(func_name, retry_num, retry_start):
+    # Skip building the extra dict when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    retry_elapsed = time.monotonic() - retry_start
+    logger.info(
+        "Function %s succeeded on attempt %d (after %d retries, %.2f s)",
+        func_name,
+        retry_num + 1,
+        retry_num,
+        retry_elapsed,
+        extra={"retry_elapsed_ms": int(retry_elapsed * 1000)},
+    )
+
+
+def _log_retries_exhausted(func_name, retries, retry_start, exc):
+    retry_elapsed = time.monotonic() - retry_start
+    logger.error(
+        "Function %s failed after %d total attempts (1 initial + %d retries, "
+        "%.2f s). Raising last exception.",
+        func_name,
+        retries + 1,
+        retries,
+        retry_elapsed,
+        exc_info=exc,
+        extra={"retry_elapsed_ms": int(retry_elapsed * 1000)},
+    )
 
 
 # Convenience decorator for database operations
-def retry_on_db_error(max_retries: int = 3):
+def retry_on_db_error_with(max_retries: int = 3, max_time: float | None = None):
     """
-    Retry decorator specifically for database connection errors.
+    Build a retry decorator specifically for database connection errors.
+
+    Use the prebuilt retry_on_db_error unless the defaults need changing.
 
     Args:
         max_retries: Maximum retry attempts (default: 3)
+        max_time: Time budget in seconds for retries (default: None, no budget)
 
     Usage:
-        @retry_on_db_error()
+        @retry_on_db_error  # or @retry_on_db_error_with(max_retries=5)
         def save_user_data(user_id, data):
             user = User.objects.get(id=user_id)
             user.data = data
@@ -150,21 +475,25 @@ def retry_on_db_error(max_retries: int = 3):
 
     return retry_with_exponential_backoff(
         max_retries=max_retries,
+        max_time=max_time,
         delays=(1.0, 2.0, 4.0),
         exceptions=(OperationalError, TransientError),
     )
 
 
 # Convenience decorator for external API calls
-def retry_on_network_error(max_retries: int = 3):
+def retry_on_network_error_with(max_retries: int = 3, max_time: float | None = 5.0):
     """
-    Retry decorator specifically for network/external API errors.
+    Build a retry decorator specifically for network/external API errors.
+
+    Use the prebuilt retry_on_network_error unless the defaults need changing.
 
     Args:
         max_retries: Maximum retry attempts (default: 3)
+        max_time: Time budget in seconds for retries (default: 5.0)
 
     Usage:
-        @retry_on_network_error()
+        @retry_on_network_error  # or @retry_on_network_error_with(max_retries=5)
         def fetch_quran_audio(surah_number, reciter_id):
             response = requests.get(f"https://api.example.com/audio/{surah_number}")
             if not response.ok:
@@ -174,6 +503,7 @@ def retry_on_network_error(max_retries: int = 3):
 
     return retry_with_exponential_backoff(
         max_retries=max_retries,
+        max_time=max_time,
         delays=(1.0, 2.0, 4.0),
         exceptions=(
             NetworkError,
@@ -185,9 +515,11 @@ def retry_on_network_error(max_retries: int = 3):
 
 
 # Convenience decorator for Redis cache operations
-def retry_on_cache_error(max_retries: int = 2):
+def retry_on_cache_error_with(max_retries: int = 2, max_time: float | None = None):
     """
-    Retry decorator for Redis cache operations (graceful degradation).
+    Build a retry decorator for Redis cache operations (graceful degradation).
+
+    Use the prebuilt retry_on_cache_error unless the defaults need changing.
 
     Uses fewer retries since cache failures should degrade gracefully.
     Handles transient Redis connection errors but allows permanent failures
@@ -195,9 +527,10 @@ def retry_on_cache_error(max_retries: int = 2):
 
     Args:
         max_retries: Maximum retry attempts (default: 2)
+        max_time: Time budget in seconds for retries (default: None, no budget)
 
     Usage:
-        @retry_on_cache_error()
+        @retry_on_cache_error  # or @retry_on_cache_error_with(max_retries=5)
         def get_cached_translation(verse_id, language):
             cache_key = f"translation:{verse_id}:{language}"
             return cache.get(cache_key)
@@ -208,6 +541,7 @@ def retry_on_cache_error(max_retries: int = 2):
 
     return retry_with_exponential_backoff(
         max_retries=max_retries,
+        max_time=max_time,
         delays=(0.5, 1.0),  # Shorter delays for cache
         exceptions=(
             ConnectionInterrupted,
@@ -216,3 +550,10 @@ def retry_on_cache_error(max_retries: int = 2):
             TransientError,
         ),
     )
+
+
+# Prebuilt decorators with the default settings, applied without parentheses:
+# @retry_on_db_error, @retry_on_network_error, @retry_on_cache_error
+retry_on_db_error = retry_on_db_error_with()
+retry_on_network_error = retry_on_network_error_with()
+retry_on_cache_error = retry_on_cache_error_with()
@@ -0,0 +1,22 @@
+"""
+Timestamp helpers for API payloads.
+
+Error responses carry a second-resolution ISO 8601 UTC timestamp
+(e.g. "2025-11-07T12:34:56Z"). ``time.strftime`` over ``time.gmtime`` formats
+it directly in C, without building an aware ``datetime`` and rewriting its
+"+00:00" suffix on every call.
+"""
+
+import time
+
+ISO_8601_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def utc_timestamp():
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    Returns:
+        str: Timestamp in the form YYYY-MM-DDTHH:MM:SSZ
+    """
+    return time.strftime(ISO_8601_UTC_FORMAT, time.gmtime())
@@ -14,19 +14,22 @@ Implements AC #7-8 from US-API-009:
 - Version from pyproject.toml with caching
 """
 
+import functools
 import importlib.metadata
+import json
 import logging
 import os
 import shutil
 import time
-from datetime import UTC
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 
+import redis
 from celery import current_app
 from django.conf import settings
 from django.core.cache import cache
-from django.db import connection
-from django.http import JsonResponse
+from django.db import connections
+from django.http import HttpResponse
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -38,8 +41,28 @@ from rest_framework.decorators import permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from backend.core.utils.timestamps import utc_timestamp
+
 logger = logging.getLogger(__name__)
 
+# Health checks are I/O-bound, so they run concurrently on a small shared pool:
+# the endpoint takes as long as the slowest check instead of the sum of all.
+HEALTH_CHECK_TIMEOUT_SECONDS = 0.9
+CELERY_INSPECT_TIMEOUT_SECONDS = 0.2
+# Last known Celery worker count, shared by all processes via the cache
+CELERY_WORKERS_CACHE_KEY = "health:celery_workers"
+CELERY_WORKERS_CACHE_TTL = 5  # seconds
+# Timeout for the dedicated health check Redis connections
+HEALTH_REDIS_TIMEOUT_SECONDS = 0.3
+HEALTH_REDIS_MAX_CONNECTIONS = 2
+# Disk usage changes on a scale of minutes; reuse the last result briefly
+DISK_CHECK_CACHE_SECONDS = 5.0
+_disk_check_result = (None, 0.0)  # (result, expiry on the monotonic clock)
+_health_check_executor = ThreadPoolExecutor(
+    max_workers=4,
+    thread_name_prefix="health-check",
+)
+
 
 @extend_schema(
     operation_id="health_check",
@@ -104,7 +127,7 @@ def health_check(request):
     - Disk space availability (warn if < 20% free)
 
     Returns:
-        JsonResponse with health status:
+        JSON response with health status:
         - 200 OK if all checks pass
         - 503 Service Unavailable if any critical check fails
 
@@ -123,32 +146,52 @@ def health_check(request):
     overall_status = "healthy"
     checks = {}
 
+    # Run all checks concurrently; any check still running at the deadline
+    # is reported as "timeout"
+    futures = {
+        "database": _health_check_executor.submit(_check_database),
+        "cache": _health_check_executor.submit(_check_cache),
+        "celery": _health_check_executor.submit(_check_celery),
+        "disk": _health_check_executor.submit(_check_disk),
+    }
+    done, not_done = wait(futures.values(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS)
+    for future in not_done:
+        future.cancel()
+    timeout_ms = HEALTH_CHECK_TIMEOUT_SECONDS * 1000
+
+    def result(name, timeout_result):
+        future = futures[name]
+        if future not in done:
+            logger.warning("Health check timed out: %s", name)
+            return timeout_result
+        return future.result()
+
     # Check PostgreSQL database (critical)
-    db_status, db_latency = _check_database()
+    db_status, db_latency = result("database", ("timeout", timeout_ms))
     checks["database"] = {"status": db_status, "latency_ms": db_latency}
     if db_status != "up":
         overall_status = "unhealthy"
 
     # Check Redis cache (critical)
-    cache_status, cache_latency = _check_cache()
+    cache_status, cache_latency = result("cache", ("timeout", timeout_ms))
     checks["cache"] = {"status": cache_status, "latency_ms": cache_latency}
     if cache_status != "up":
         overall_status = "unhealthy"
 
     # Check Celery workers (critical)
-    celery_status, worker_count = _check_celery()
+    celery_status, worker_count = result("celery", ("timeout", 0))
     checks["celery"] = {"status": celery_status, "workers": worker_count}
     if celery_status != "up":
         overall_status = "unhealthy"
 
     # Check disk space (warning only)
-    disk_status, free_percent = _check_disk()
+    disk_status, free_percent = result("disk", ("timeout", 0.0))
     checks["disk"] = {"status": disk_status, "free_percent": free_percent}
 
     # Build response
     response_data = {
         "status": overall_status,
-        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        "timestamp": utc_timestamp(),
         "checks": checks,
     }
 
@@ -165,41 +208,76 @@ def health_check(request):
             },
         )
 
-    return JsonResponse(response_data, status=http_status)
+    # Compact json.dumps of plain types: skips JsonResponse's encoder class
+    return HttpResponse(
+        json.dumps(response_data, separators=(",", ":")),
+        content_type="application/json",
+        status=http_status,
+    )
+
+
+def _elapsed_ms(start_ns):
+    """
+    Return milliseconds elapsed since start_ns, to two decimal places.
+
+    Uses the monotonic perf_counter_ns() clock, which (unlike time.time())
+    can't go backwards on NTP adjustments, with integer arithmetic for the
+    rounding.
+    """
+    return (time.perf_counter_ns() - start_ns) // 10_000 / 100
 
 
 def _check_database():
     """
     Check PostgreSQL database connectivity and latency.
 
+    Uses the dedicated "health" database alias (no persistent connections,
+    short timeouts) so the probe doesn't compete with application queries.
+    The connection is closed afterwards rather than left open on the health
+    check worker thread.
+
     Returns:
         tuple: (status: str, latency_ms: float)
         - status: "up" or "down"
         - latency_ms: Query execution time in milliseconds
     """
+    connection = connections["health"]
     try:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         with connection.cursor() as cursor:
             cursor.execute("SELECT 1")
             cursor.fetchone()
-        latency_ms = (time.time() - start_time) * 1000
-        return ("up", round(latency_ms, 2))
+        return ("up", _elapsed_ms(start_ns))
     except Exception:
         logger.exception("Database health check failed")
         return ("down", 0.0)
+    finally:
+        connection.close()
 
 
 def _check_cache():
     """
     Check Redis cache connectivity and latency.
 
+    On Redis a single PING is enough: one round-trip, no serialization and
+    no write. It goes through a dedicated small pool with short timeouts, so
+    the probe doesn't compete with application traffic for the cache's
+    connection pool. Other cache backends (e.g. the local-memory cache in
+    tests) are checked with a set/get pair.
+
     Returns:
         tuple: (status: str, latency_ms: float)
         - status: "up" or "down"
-        - latency_ms: Read/write operation time in milliseconds
+        - latency_ms: PING (or read/write) time in milliseconds
     """
     try:
-        start_time = time.time()
+        redis_client = _get_health_redis_client()
+        start_ns = time.perf_counter_ns()
+
+        if redis_client is not None:
+            redis_client.ping()
+            return ("up", _elapsed_ms(start_ns))
+
         cache_key = "health_check_test"
         cache_value = "ok"
 
@@ -209,10 +287,10 @@ def _check_cache():
         # Test read operation
         result = cache.get(cache_key)
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = _elapsed_ms(start_ns)
 
         if result == cache_value:
-            return ("up", round(latency_ms, 2))
+            return ("up", latency_ms)
         logger.warning("Cache read/write mismatch in health check")
         return ("down", 0.0)
 
@@ -221,19 +299,53 @@ def _check_cache():
         return ("down", 0.0)
 
 
+@functools.cache
+def _get_health_redis_client():
+    """
+    Return the Redis client dedicated to health checks.
+
+    Built once per process from the default cache's location. Returns None
+    when the default cache is not backed by django-redis.
+
+    The client is shared by the health check thread pool and concurrent
+    health requests, so it draws from a small blocking pool (each caller
+    gets its own socket) rather than holding a single connection.
+    """
+    cache_config = settings.CACHES["default"]
+    if not cache_config["BACKEND"].startswith("django_redis."):
+        return None
+    pool = redis.BlockingConnectionPool.from_url(
+        cache_config["LOCATION"],
+        max_connections=HEALTH_REDIS_MAX_CONNECTIONS,
+        timeout=HEALTH_REDIS_TIMEOUT_SECONDS,
+        socket_timeout=HEALTH_REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=HEALTH_REDIS_TIMEOUT_SECONDS,
+    )
+    return redis.Redis(connection_pool=pool)
+
+
 def _check_celery():
     """
     Check Celery worker status.
 
+    Workers are counted with a ping broadcast (smaller replies than stats())
+    and the count is cached for a few seconds, so most health probes need no
+    broker round-trip at all.
+
     Returns:
         tuple: (status: str, worker_count: int)
         - status: "up" if at least one worker alive, "down" otherwise
         - worker_count: Number of active Celery workers
     """
     try:
-        # Inspect active workers
-        stats = current_app.control.inspect().stats()
-        worker_count = len(stats) if stats else 0
+        worker_count = cache.get(CELERY_WORKERS_CACHE_KEY)
+        if worker_count is None:
+            # Ping active workers (bounded wait for worker replies)
+            replies = current_app.control.inspect(
+                timeout=CELERY_INSPECT_TIMEOUT_SECONDS,
+            ).ping()
+            worker_count = len(replies) if replies else 0
+            cache.set(CELERY_WORKERS_CACHE_KEY, worker_count, CELERY_WORKERS_CACHE_TTL)
 
         if worker_count > 0:
             return ("up", worker_count)
@@ -249,11 +361,22 @@ def _check_disk():
     """
     Check disk space availability.
 
+    The result is reused for DISK_CHECK_CACHE_SECONDS so frequent probes don't
+    each pay for a statvfs() call. Tuple assignment is atomic, so no lock is
+    needed, and a slightly stale value is harmless.
+
     Returns:
         tuple: (status: str, free_percent: float)
         - status: "ok" if > 20% free, "low" if < 20%, "critical" if < 10%
         - free_percent: Percentage of free disk space
     """
+    global _disk_check_result  # noqa: PLW0603
+
+    now = time.monotonic()
+    result, expiry = _disk_check_result
+    if expiry > now:
+        return result
+
     try:
         stat = shutil.disk_usage("/")
         free_percent = (stat.free / stat.total) * 100
@@ -263,16 +386,20 @@ def _check_disk():
 
         if free_percent < critical_threshold:
             logger.critical("Critical disk space: %.1f%% free", free_percent)
-            return ("critical", round(free_percent, 1))
-        if free_percent < low_threshold:
+            result = ("critical", round(free_percent, 1))
+        elif free_percent < low_threshold:
             logger.warning("Low disk space: %.1f%% free", free_percent)
-            return ("low", round(free_percent, 1))
-        return ("ok", round(free_percent, 1))
+            result = ("low", round(free_percent, 1))
+        else:
+            result = ("ok", round(free_percent, 1))
 
     except Exception:
         logger.exception("Disk space check failed")
         return ("unknown", 0.0)
 
+    _disk_check_result = (result, now + DISK_CHECK_CACHE_SECONDS)
+    return result
+
 
 # ============================================================================
 # PROJECT METADATA ENDPOINT - /api/meta/
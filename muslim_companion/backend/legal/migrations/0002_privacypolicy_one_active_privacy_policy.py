@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+def deactivate_older_policies(apps, schema_editor):
+    """Keep only the most recent active policy active before adding the constraint."""
+    PrivacyPolicy = apps.get_model("legal", "PrivacyPolicy")
+    active = PrivacyPolicy.objects.filter(is_active=True).order_by(
+        "-effective_date",
+        "-last_updated",
+    )
+    latest = active.first()
+    if latest is not None:
+        active.exclude(pk=latest.pk).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('legal', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(deactivate_older_policies, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='privacypolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('is_active',), name='one_active_privacy_policy'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 
@@ -37,13 +38,25 @@ class PrivacyPolicy(models.Model):
         verbose_name = _("Privacy Policy")
         verbose_name_plural = _("Privacy Policies")
         ordering = ["-effective_date"]
+        constraints = [
+            # At most one active policy, enforced by a partial unique index
+            models.UniqueConstraint(
+                fields=["is_active"],
+                condition=models.Q(is_active=True),
+                name="one_active_privacy_policy",
+            ),
+        ]
 
     def __str__(self):
         return f"Privacy Policy v{self.version}"
 
     def save(self, *args, **kwargs):
         """Ensure only one active policy at a time."""
-        if self.is_active:
-            # Deactivate all other policies
-            PrivacyPolicy.objects.filter(is_active=True).update(is_active=False)
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            if self.is_active:
+                # Deactivate all other policies (the constraint rejects a
+                # concurrent save that activates another policy)
+                PrivacyPolicy.objects.filter(is_active=True).exclude(
+                    pk=self.pk,
+                ).update(is_active=False)
+            super().save(*args, **kwargs)
@@ -10,6 +10,9 @@ class ForceArabicMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        translation.activate("ar")
+        # Activation is thread-local and usually still "ar" from the previous
+        # request on this thread, so only re-activate when something changed it
+        if translation.get_language() != "ar":
+            translation.activate("ar")
         request.LANGUAGE_CODE = "ar"
         return self.get_response(request)
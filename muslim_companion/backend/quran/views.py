@@ -206,7 +206,7 @@ class SurahDetailView(generics.RetrieveAPIView):
         # Check cache
         cached_response = self.cache_manager.get(cache_key)
         if cached_response is not None:
-            logger.debug(f"Cache hit for Surah {pk}")
+            logger.debug("Cache hit for Surah %s", pk)
             return Response(cached_response)
 
         try:
@@ -299,7 +299,7 @@ class SurahVersesView(generics.RetrieveAPIView):
         if not verse_start and not verse_end:
             cached_response = self.cache_manager.get(cache_key)
             if cached_response is not None:
-                logger.debug(f"Cache hit for Surah {surah_id} verses")
+                logger.debug("Cache hit for Surah %s verses", surah_id)
                 return Response(cached_response)
 
         try:
@@ -438,7 +438,7 @@ class VerseDetailView(generics.RetrieveAPIView):
         # Check cache
         cached_response = self.cache_manager.get(cache_key)
         if cached_response is not None:
-            logger.debug(f"Cache hit for Verse {pk}")
+            logger.debug("Cache hit for Verse %s", pk)
             return Response(cached_response)
 
         try:
@@ -2,8 +2,12 @@ import re
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.tokens import default_token_generator
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils.encoding import force_str
+from django.utils.http import urlsafe_base64_decode
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -11,6 +15,26 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from backend.users.models import User
 from backend.users.models import UserProfile
 
+# Password complexity patterns (AC #6), compiled once at import
+_UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+_LOWERCASE_PATTERN = re.compile(r"[a-z]")
+_DIGIT_PATTERN = re.compile(r"\d")
+
+
+def _issue_tokens(user):
+    """
+    Issue a new JWT refresh/access token pair for a user.
+
+    Every login or registration gets its own pair on purpose: refresh tokens
+    are rotated and blacklisted individually (logout, rotation), so sharing
+    a pair between sessions would let one session revoke another.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        "access_token": str(refresh.access_token),
+        "refresh_token": str(refresh),
+    }
+
 
 class UserSerializer(serializers.ModelSerializer[User]):
     """
@@ -67,12 +91,17 @@ class UserRegistrationSerializer(serializers.Serializer):
     )
 
     def validate_email(self, value):
-        """Validate that email is unique."""
-        if User.objects.filter(email=value).exists():
+        """Validate that email is unique (case-insensitively)."""
+        email = value.lower()
+        if (
+            User.objects.annotate(email_lower=Lower("email"))
+            .filter(email_lower=email)
+            .exists()
+        ):
             raise serializers.ValidationError(
                 _("A user with this email already exists."),
             )
-        return value.lower()
+        return email
 
     def validate_password(self, value):
         """Validate password strength requirements (AC #6)."""
@@ -83,15 +112,15 @@ class UserRegistrationSerializer(serializers.Serializer):
             )
 
         # Complexity validation: uppercase, lowercase, digit
-        if not re.search(r"[A-Z]", value):
+        if not _UPPERCASE_PATTERN.search(value):
             raise serializers.ValidationError(
                 _("Password must contain at least one uppercase letter."),
             )
-        if not re.search(r"[a-z]", value):
+        if not _LOWERCASE_PATTERN.search(value):
             raise serializers.ValidationError(
                 _("Password must contain at least one lowercase letter."),
             )
-        if not re.search(r"\d", value):
+        if not _DIGIT_PATTERN.search(value):
             raise serializers.ValidationError(
                 _("Password must contain at least one digit."),
             )
@@ -116,21 +145,30 @@ class UserRegistrationSerializer(serializers.Serializer):
         """Create user and user profile in a single transaction (AC #1, #14, #15)."""
         validated_data.pop("password_confirm")
 
+        # Generate unique username from email: fetch every colliding username
+        # (base or base<digits>) in one query, then pick the first free suffix
+        base_username = validated_data["email"].split("@")[0]
+        taken = set(
+            User.objects.filter(
+                username__regex=rf"^{re.escape(base_username)}\d*$",
+            ).values_list("username", flat=True),
+        )
+        username = base_username
+        counter = 1
+        while username in taken:
+            username = f"{base_username}{counter}"
+            counter += 1
+
+        # Hash the password (AC #13) before opening the transaction so the
+        # slow hasher does not run while the transaction is held open
+        user = User(
+            username=User.normalize_username(username),
+            email=User.objects.normalize_email(validated_data["email"]),
+        )
+        user.set_password(validated_data["password"])
+
         with transaction.atomic():
-            # Generate unique username from email
-            username = validated_data["email"].split("@")[0]
-            base_username = username
-            counter = 1
-            while User.objects.filter(username=username).exists():
-                username = f"{base_username}{counter}"
-                counter += 1
-
-            # Create user with hashed password (AC #13)
-            user = User.objects.create_user(
-                username=username,
-                email=validated_data["email"],
-                password=validated_data["password"],
-            )
+            user.save(force_insert=True)
 
             # Create UserProfile (AC #15)
             UserProfile.objects.create(user=user)
@@ -139,18 +177,13 @@ class UserRegistrationSerializer(serializers.Serializer):
 
     def to_representation(self, instance):
         """Return user data with JWT tokens (AC #2)."""
-        refresh = RefreshToken.for_user(instance)
-
         return {
             "user": {
                 "id": str(instance.id),
                 "email": instance.email,
                 "username": instance.username,
             },
-            "tokens": {
-                "access_token": str(refresh.access_token),
-                "refresh_token": str(refresh),
-            },
+            "tokens": _issue_tokens(instance),
         }
 
 
@@ -199,15 +232,7 @@ class UserLoginSerializer(serializers.Serializer):
 
     def to_representation(self, instance):
         """Return JWT tokens (AC #2, #7, #8)."""
-        user = self.validated_data["user"]
-        refresh = RefreshToken.for_user(user)
-
-        return {
-            "tokens": {
-                "access_token": str(refresh.access_token),
-                "refresh_token": str(refresh),
-            },
-        }
+        return {"tokens": _issue_tokens(self.validated_data["user"])}
 
 
 class PasswordResetRequestSerializer(serializers.Serializer):
@@ -226,10 +251,12 @@ class PasswordResetRequestSerializer(serializers.Serializer):
     )
 
     def validate_email(self, value):
-        """Validate that email exists."""
-        if not User.objects.filter(email=value).exists():
-            # Don't reveal whether email exists for security
-            pass
+        """
+        Normalize the email address.
+
+        Existence is deliberately not checked here: the response must not
+        reveal whether the email is registered, so the lookup would be wasted.
+        """
         return value.lower()
 
 
@@ -271,15 +298,15 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
             raise serializers.ValidationError(
                 _("Password must be at least 8 characters long."),
             )
-        if not re.search(r"[A-Z]", value):
+        if not _UPPERCASE_PATTERN.search(value):
             raise serializers.ValidationError(
                 _("Password must contain at least one uppercase letter."),
             )
-        if not re.search(r"[a-z]", value):
+        if not _LOWERCASE_PATTERN.search(value):
             raise serializers.ValidationError(
                 _("Password must contain at least one lowercase letter."),
             )
-        if not re.search(r"\d", value):
+        if not _DIGIT_PATTERN.search(value):
             raise serializers.ValidationError(
                 _("Password must contain at least one digit."),
             )
@@ -298,13 +325,10 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
                 {"new_password_confirm": _("Passwords do not match.")},
             )
 
-        from django.contrib.auth.tokens import default_token_generator
-        from django.utils.encoding import force_str
-        from django.utils.http import urlsafe_base64_decode
-
         try:
             uid = force_str(urlsafe_base64_decode(attrs["uid"]))
-            user = User.objects.get(pk=uid)
+            # Only the columns the token generator hashes are needed
+            user = User.objects.only("password", "last_login", "email").get(pk=uid)
         except (TypeError, ValueError, OverflowError, User.DoesNotExist):
             raise serializers.ValidationError({"detail": _("Invalid reset link.")})
 
@@ -393,8 +417,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
         # Extract user-related data
         user_data = validated_data.pop("user", {})
 
-        # Update UserProfile fields
-        instance = super().update(instance, validated_data)
+        # Update only the submitted UserProfile columns (PATCH sends a subset)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
 
         # Update User.is_analytics_enabled if provided using queryset update
         if "is_analytics_enabled" in user_data:
@@ -2,12 +2,28 @@
 
 from rest_framework.throttling import AnonRateThrottle
 
+from backend.core.throttling import FixedWindowThrottleMixin
+from backend.core.throttling import GCRAThrottleMixin
+from backend.core.throttling import LocalBlockMixin
+from backend.core.throttling import RequestIdentMixin
 
-class AuthEndpointThrottle(AnonRateThrottle):
+
+class AuthEndpointThrottle(
+    RequestIdentMixin,
+    LocalBlockMixin,
+    GCRAThrottleMixin,
+    FixedWindowThrottleMixin,
+    AnonRateThrottle,
+):
     """
     Rate limiting for authentication endpoints.
 
     Limits anonymous users to 5 requests per minute to prevent brute force attacks.
+    Evaluated like the global throttles: one atomic GCRA script call on Redis,
+    or a fixed-window counter on other cache backends.
+
+    Cache key format: throttle_auth_{ip_address}
     """
 
+    scope = "auth"
     rate = "5/min"
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 from django.conf import settings
@@ -5,6 +6,8 @@ from django.contrib.auth.tokens import default_token_generator
 from django.db import transaction
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
+from django.utils.translation import get_language
+from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import OpenApiExample
 from drf_spectacular.utils import OpenApiResponse
@@ -44,11 +47,29 @@ audit_logger = logging.getLogger(
 )  # US-API-007: Separate audit logger
 
 
+@functools.lru_cache(maxsize=256)
+def _account_locked_message(language, minutes_remaining):
+    """
+    Return the translated lockout message for a language and minute count.
+
+    Lockout lasts at most an hour, so there are only a few dozen distinct
+    messages per language; repeated 423 responses (e.g. a bot retrying a
+    locked account) reuse the formatted string.
+    """
+    return (
+        gettext(
+            "Account temporarily locked due to multiple failed "
+            "login attempts. Try again in %s minutes.",
+        )
+        % minutes_remaining
+    )
+
+
 def get_client_ip(request):
     """Extract client IP address from request."""
     x_forwarded_for = request.headers.get("x-forwarded-for")
     if x_forwarded_for:
-        ip = x_forwarded_for.split(",")[0].strip()
+        ip = x_forwarded_for.partition(",")[0].strip()
     else:
         ip = request.META.get("REMOTE_ADDR")
     return ip
@@ -168,7 +189,7 @@ class UserRegistrationView(APIView):
             )
 
             return Response(
-                serializer.to_representation(user),
+                serializer.data,
                 status=status.HTTP_201_CREATED,
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -269,11 +290,14 @@ class UserLoginView(APIView):
     )
     def post(self, request):
         """Handle user login request with account lockout protection."""
-        email = request.data.get("email", "").lower()
+        email = request.data.get("email")
+        email = email.lower() if isinstance(email, str) else ""
         ip_address = get_client_ip(request)
 
         # Check if account is locked (AC #12)
-        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
+        is_locked, seconds_remaining, has_attempts = (
+            AccountLockoutService.check_lockout(email)
+        )
         if is_locked:
             minutes_remaining = (seconds_remaining + 59) // 60  # Round up
 
@@ -291,11 +315,10 @@ class UserLoginView(APIView):
 
             return Response(
                 {
-                    "detail": _(
-                        "Account temporarily locked due to multiple failed "
-                        "login attempts. Try again in %s minutes.",
-                    )
-                    % minutes_remaining,
+                    "detail": _account_locked_message(
+                        get_language(),
+                        minutes_remaining,
+                    ),
                     "retry_after": seconds_remaining,
                 },
                 status=status.HTTP_423_LOCKED,
@@ -304,8 +327,9 @@ class UserLoginView(APIView):
         # Attempt authentication
         serializer = UserLoginSerializer(data=request.data)
         if serializer.is_valid():
-            # Successful login - reset attempt counter
-            AccountLockoutService.reset_attempts(email)
+            # Successful login - reset attempt counter (if anything to reset)
+            if has_attempts:
+                AccountLockoutService.reset_attempts(email)
 
             # US-API-007 AC #1: Log successful login
             user = serializer.validated_data.get("user")
@@ -321,7 +345,7 @@ class UserLoginView(APIView):
             )
 
             return Response(
-                serializer.to_representation(serializer.validated_data),
+                serializer.data,
                 status=status.HTTP_200_OK,
             )
 
@@ -514,8 +538,13 @@ class PasswordResetRequestView(APIView):
         if serializer.is_valid():
             email = serializer.validated_data["email"]
 
-            try:
-                user = User.objects.get(email=email)
+            # Only the columns the token generator hashes are needed
+            user = (
+                User.objects.filter(email=email)
+                .only("password", "last_login", "email")
+                .first()
+            )
+            if user is not None:
                 # Generate reset token and uid
                 token = default_token_generator.make_token(user)
                 uid = urlsafe_base64_encode(force_bytes(user.pk))
@@ -547,13 +576,6 @@ class PasswordResetRequestView(APIView):
                     },
                 )
 
-                return Response(
-                    {"message": _("Password reset email sent if account exists")},
-                    status=status.HTTP_200_OK,
-                )
-            except User.DoesNotExist:
-                pass
-
             # Always return success for security (don't reveal if email exists)
             return Response(
                 {"message": _("Password reset email sent if account exists")},
@@ -655,21 +677,32 @@ class ThrottledTokenRefreshView(TokenRefreshView):
     )
     def post(self, request, *args, **kwargs):
         """Override to use OAuth 2.0 standard parameter names (ADR-012)."""
-        # Accept both 'refresh_token' (OAuth 2.0) and 'refresh' (SimpleJWT default)
-        if "refresh_token" in request.data and "refresh" not in request.data:
-            request.data["refresh"] = request.data["refresh_token"]
-
         response = super().post(request, *args, **kwargs)
 
         # Rename response keys for OAuth 2.0 compliance (ADR-012)
         if response.status_code == status.HTTP_200_OK:
-            if "access" in response.data:
-                response.data["access_token"] = response.data.pop("access")
-            if "refresh" in response.data:
-                response.data["refresh_token"] = response.data.pop("refresh")
+            data = response.data
+            access = data.pop("access", None)
+            if access is not None:
+                data["access_token"] = access
+            refresh = data.pop("refresh", None)
+            if refresh is not None:
+                data["refresh_token"] = refresh
 
         return response
 
+    def get_serializer(self, *args, **kwargs):
+        """
+        Accept both 'refresh_token' (OAuth 2.0) and 'refresh' (SimpleJWT default).
+
+        The serializer only reads 'refresh', so the input is remapped instead
+        of mutating request.data (immutable for form-encoded requests).
+        """
+        data = kwargs.get("data")
+        if data is not None and "refresh" not in data and "refresh_token" in data:
+            kwargs["data"] = {"refresh": data["refresh_token"]}
+        return super().get_serializer(*args, **kwargs)
+
 
 class PasswordResetConfirmView(APIView):
     """
@@ -743,7 +776,7 @@ class PasswordResetConfirmView(APIView):
         if serializer.is_valid():
             user = serializer.validated_data["user"]
             user.set_password(serializer.validated_data["new_password"])
-            user.save()
+            user.save(update_fields=["password"])
 
             return Response(
                 {"message": _("Password has been reset successfully")},
@@ -778,7 +811,12 @@ class UserProfileViewSet(RetrieveModelMixin, UpdateModelMixin, GenericViewSet):
     queryset = UserProfile.objects.all()
 
     def get_object(self):
-        """Return the current user's profile."""
+        """
+        Return the current user's profile.
+
+        The reverse one-to-one lookup caches request.user on the profile, so
+        serializing is_analytics_enabled does not query the user again.
+        """
         return self.request.user.profile
 
     def retrieve(self, request, *args, **kwargs):
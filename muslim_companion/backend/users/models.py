@@ -4,6 +4,7 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.db.models import BooleanField
 from django.db.models import CharField
+from django.db.models.functions import Lower
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -42,6 +43,13 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # Emails differing only in case belong to the same person; the
+            # expression index also serves case-insensitive email lookups
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_uniq"),
+        ]
+
     def get_absolute_url(self) -> str:
         """Get URL for user's detail view.
 
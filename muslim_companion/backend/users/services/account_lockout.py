@@ -7,15 +7,34 @@ Tracks failed login attempts per email address and locks accounts after
 
 import logging
 import time
+import uuid
 
 from django.core.cache import cache
 
+from backend.core.utils.redis_client import get_redis_client
+
 logger = logging.getLogger(__name__)
 
 # Constants
 MAX_ATTEMPTS = 10
 LOCKOUT_DURATION = 3600  # 1 hour in seconds
 ATTEMPT_WINDOW = 3600  # 1 hour in seconds
+MS_PER_SECOND = 1000
+
+# Rolling window of failed attempts kept as a sorted set scored by time (ms).
+# Trims attempts older than the window, records this one and returns the
+# number left, atomically in one round-trip.
+# KEYS[1]: attempt log key
+# ARGV[1]: now (ms), ARGV[2]: window (ms), ARGV[3]: unique member for this attempt
+# Returns the number of attempts within the window, including this one
+ROLLING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+redis.call("ZADD", KEYS[1], now, ARGV[3])
+redis.call("PEXPIRE", KEYS[1], window)
+return redis.call("ZCARD", KEYS[1])
+"""
 
 
 class AccountLockoutService:
@@ -24,17 +43,20 @@ class AccountLockoutService:
 
     Uses Redis for persistent storage with automatic expiration.
     Thread-safe and supports distributed deployments.
+
+    Emails must be normalized (lowercased) by the caller, once per request;
+    keys are built from them as-is.
     """
 
     @staticmethod
     def _get_attempt_key(email: str) -> str:
-        """Generate Redis key for attempt counter."""
-        return f"auth:attempts:{email.lower()}"
+        """Generate Redis key for the attempt log (email already lowercased)."""
+        return f"auth:attempt_log:{email}"
 
     @staticmethod
     def _get_lockout_key(email: str) -> str:
-        """Generate Redis key for lockout status."""
-        return f"auth:lockout:{email.lower()}"
+        """Generate Redis key for lockout status (email already lowercased)."""
+        return f"auth:lockout:{email}"
 
     @classmethod
     def record_failed_attempt(
@@ -46,22 +68,21 @@ class AccountLockoutService:
         Record a failed login attempt for the given email.
 
         Args:
-            email: User's email address
+            email: User's email address, lowercased
             ip_address: IP address of the request (for logging)
 
         Returns:
             True if account was locked, False otherwise
         """
+        if not _is_trackable_email(email):
+            return False
+
         try:
             attempt_key = cls._get_attempt_key(email)
             lockout_key = cls._get_lockout_key(email)
 
-            # Get current attempt count
-            attempts = cache.get(attempt_key, 0)
-            attempts += 1
-
-            # Store updated attempt count with TTL
-            cache.set(attempt_key, attempts, timeout=ATTEMPT_WINDOW)
+            # Record the attempt and count those within the rolling window
+            attempts = _record_attempt(attempt_key, time.time())
 
             # Log failed attempt
             logger.info(
@@ -101,37 +122,61 @@ class AccountLockoutService:
         Check if an account is currently locked.
 
         Args:
-            email: User's email address
+            email: User's email address, lowercased
 
         Returns:
             Tuple of (is_locked, seconds_remaining)
             - is_locked: True if account is locked
             - seconds_remaining: Seconds until lockout expires (0 if not locked)
         """
+        locked, seconds_remaining, _ = cls.check_lockout(email)
+        return (locked, seconds_remaining)
+
+    @classmethod
+    def check_lockout(cls, email: str) -> tuple[bool, int, bool]:
+        """
+        Check lockout status and whether failed attempts are recorded.
+
+        Both keys are read in one round-trip, so the login view can skip
+        reset_attempts() after a successful login with no prior failures.
+
+        Args:
+            email: User's email address, lowercased
+
+        Returns:
+            Tuple of (is_locked, seconds_remaining, has_attempts)
+            - is_locked: True if account is locked
+            - seconds_remaining: Seconds until lockout expires (0 if not locked)
+            - has_attempts: True if failed attempts or a lockout are recorded
+        """
+        if not _is_trackable_email(email):
+            return (False, 0, False)
+
         try:
+            attempt_key = cls._get_attempt_key(email)
             lockout_key = cls._get_lockout_key(email)
 
-            # Check if lockout timestamp exists
-            lockout_timestamp = cache.get(lockout_key)
+            lockout_timestamp, has_attempts = _read_lockout_state(
+                attempt_key,
+                lockout_key,
+            )
 
             if lockout_timestamp:
                 # Calculate seconds remaining
                 now = time.time()
                 seconds_remaining = max(0, int(lockout_timestamp - now))
 
+                # An expired timestamp is left for the key's own TTL to remove
                 if seconds_remaining > 0:
-                    return (True, seconds_remaining)
-
-                # Lockout has expired, clean up
-                cache.delete(lockout_key)
+                    return (True, seconds_remaining, has_attempts)
 
             # Account not locked
-            return (False, 0)
+            return (False, 0, has_attempts)
 
         except Exception:
             # Graceful degradation: log error and allow login
             logger.exception("Error checking lockout for %s", email)
-            return (False, 0)
+            return (False, 0, True)
 
     @classmethod
     def reset_attempts(cls, email: str) -> None:
@@ -141,15 +186,14 @@ class AccountLockoutService:
         Called after successful login or manual unlock by admin.
 
         Args:
-            email: User's email address
+            email: User's email address, lowercased
         """
         try:
             attempt_key = cls._get_attempt_key(email)
             lockout_key = cls._get_lockout_key(email)
 
-            # Delete both keys
-            cache.delete(attempt_key)
-            cache.delete(lockout_key)
+            # Delete both keys in one round-trip
+            cache.delete_many([attempt_key, lockout_key])
 
             logger.info("Lockout cleared for %s", email)
 
@@ -163,16 +207,114 @@ class AccountLockoutService:
         Get the current failed attempt count for the given email.
 
         Args:
-            email: User's email address
+            email: User's email address, lowercased
 
         Returns:
             Number of failed attempts (0 if none)
         """
         try:
             attempt_key = cls._get_attempt_key(email)
-            return cache.get(attempt_key, 0)
+            return _count_attempts(attempt_key, time.time())
 
         except Exception:
             # Graceful degradation: log error and return 0
             logger.exception("Error getting attempt count for %s", email)
             return 0
+
+
+def _is_trackable_email(email: str) -> bool:
+    """
+    Check whether an email can have lockout state worth a cache lookup.
+
+    Missing or malformed emails (common in bot traffic) never match an
+    account, so the serializer rejects them without touching the cache.
+    """
+    return bool(email) and "@" in email
+
+
+def _record_attempt(attempt_key: str, now: float) -> int:
+    """
+    Record a failed attempt and count the attempts in the last ATTEMPT_WINDOW.
+
+    The window rolls: each attempt stops counting an hour after it was made,
+    so nine failures just before a fixed window boundary can't be followed by
+    a fresh budget of ten just after it.
+
+    On Redis the attempts are a sorted set scored by time, trimmed, appended to
+    and counted by one Lua script (one round-trip, atomic under concurrency).
+    Other backends keep a list of timestamps under the key; that
+    read-modify-write is not atomic, which is acceptable for the local-memory
+    caches used in development and tests.
+
+    Args:
+        attempt_key: Attempt log cache key
+        now: Current time (seconds since the epoch)
+
+    Returns:
+        Number of attempts within the window, including this one
+
+    Raises:
+        redis.exceptions.RedisError: If Redis is unavailable
+    """
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        return redis_client.eval(
+            ROLLING_WINDOW_SCRIPT,
+            1,
+            cache.make_key(attempt_key),
+            int(now * MS_PER_SECOND),
+            ATTEMPT_WINDOW * MS_PER_SECOND,
+            uuid.uuid4().hex,
+        )
+
+    attempts = _recent_attempts(cache.get(attempt_key, []), now)
+    attempts.append(now)
+    cache.set(attempt_key, attempts, timeout=ATTEMPT_WINDOW)
+    return len(attempts)
+
+
+def _count_attempts(attempt_key: str, now: float) -> int:
+    """Count the recorded attempts within the last ATTEMPT_WINDOW seconds."""
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        cutoff_ms = int((now - ATTEMPT_WINDOW) * MS_PER_SECOND)
+        return redis_client.zcount(
+            cache.make_key(attempt_key),
+            f"({cutoff_ms}",
+            "+inf",
+        )
+    return len(_recent_attempts(cache.get(attempt_key, []), now))
+
+
+def _recent_attempts(timestamps: list[float], now: float) -> list[float]:
+    """Drop attempt timestamps that have left the rolling window."""
+    cutoff = now - ATTEMPT_WINDOW
+    return [timestamp for timestamp in timestamps if timestamp > cutoff]
+
+
+def _read_lockout_state(
+    attempt_key: str,
+    lockout_key: str,
+) -> tuple[float | None, bool]:
+    """
+    Read the lockout timestamp and whether attempts are recorded.
+
+    On Redis the attempt log is a sorted set, which MGET reports as missing,
+    so both keys are read in one pipeline instead and the lockout value is
+    decoded with the cache client's serializer.
+
+    Returns:
+        Tuple of (lockout_timestamp or None, has_attempts)
+    """
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.get(cache.make_key(lockout_key))
+        pipeline.exists(cache.make_key(attempt_key))
+        raw_lockout, attempts_exist = pipeline.execute()
+        if raw_lockout is None:
+            return (None, bool(attempts_exist))
+        return (cache.client.decode(raw_lockout), True)
+
+    state = cache.get_many([attempt_key, lockout_key])
+    return (state.get(lockout_key), bool(state))
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 from celery import shared_task
@@ -10,6 +11,31 @@ from .models import User
 
 logger = logging.getLogger(__name__)
 
+RESET_EMAIL_TEMPLATE = "users/emails/password_reset.html"
+SITE_NAME = "Muslim Companion"
+_RESET_LINK_PLACEHOLDER = "__RESET_LINK__"
+_USER_EMAIL_PLACEHOLDER = "__USER_EMAIL__"
+
+
+@functools.cache
+def _password_reset_plain_skeleton():
+    """
+    Return the plain-text reset email with placeholders for per-user values.
+
+    strip_tags() is regex-heavy and its output only varies by the reset link
+    and email address, so it runs once per worker process instead of once
+    per email; the values are substituted with str.replace().
+    """
+    html_message = render_to_string(
+        RESET_EMAIL_TEMPLATE,
+        {
+            "reset_link": _RESET_LINK_PLACEHOLDER,
+            "user_email": _USER_EMAIL_PLACEHOLDER,
+            "site_name": SITE_NAME,
+        },
+    )
+    return strip_tags(html_message)
+
 
 @shared_task()
 def get_users_count():
@@ -38,12 +64,17 @@ def send_password_reset_email(self, user_email, reset_url, uid, token):
         context = {
             "reset_link": reset_link,
             "user_email": user_email,
-            "site_name": "Muslim Companion",
+            "site_name": SITE_NAME,
         }
 
-        # Render HTML email template
-        html_message = render_to_string("users/emails/password_reset.html", context)
-        plain_message = strip_tags(html_message)
+        # Render HTML email template; the plain-text part reuses a cached
+        # tag-stripped rendering
+        html_message = render_to_string(RESET_EMAIL_TEMPLATE, context)
+        plain_message = (
+            _password_reset_plain_skeleton()
+            .replace(_RESET_LINK_PLACEHOLDER, reset_link)
+            .replace(_USER_EMAIL_PLACEHOLDER, user_email)
+        )
 
         # Send email via Mailgun (configured in settings)
         send_mail(
@@ -4,6 +4,8 @@ Tests for JWT token blacklisting functionality.
 Tests that tokens are properly blacklisted on logout and cannot be reused.
 """
 
+from unittest.mock import patch
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -12,6 +14,7 @@ from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from backend.users.api.throttling import AuthEndpointThrottle
 from backend.users.models import User
 
 
@@ -19,16 +22,10 @@ from backend.users.models import User
 class TestTokenBlacklisting:
     """Test JWT token blacklisting on logout."""
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(autouse=True, scope="class")
     def _disable_throttling(self):
-        """Disable throttling for these tests."""
-        from unittest.mock import patch
-
-        # Mock the throttle's allow_request method to always return True
-        with patch(
-            "backend.users.api.throttling.AuthEndpointThrottle.allow_request",
-            return_value=True,
-        ):
+        """Disable throttling once for the whole class."""
+        with patch.object(AuthEndpointThrottle, "allow_request", return_value=True):
             yield
 
     @pytest.fixture
@@ -14,10 +14,23 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from backend.users.api.throttling import AuthEndpointThrottle
+from backend.users.services.account_lockout import MAX_ATTEMPTS
 from backend.users.services.account_lockout import AccountLockoutService
 
 User = get_user_model()
 
+WRONG_LOGIN = {"email": "lockout@example.com", "password": "wrongpassword"}
+IP1_HEADERS = {"HTTP_X_FORWARDED_FOR": "192.168.1.1"}
+IP2_HEADERS = {"HTTP_X_FORWARDED_FOR": "192.168.1.2"}
+IP3_HEADERS = {"HTTP_X_FORWARDED_FOR": "192.168.1.3"}
+
+
+def lock_account(email):
+    """Lock an account through the service instead of ten login requests."""
+    for _ in range(MAX_ATTEMPTS):
+        AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
 
 @pytest.mark.django_db
 class TestAccountLockout:
@@ -30,14 +43,10 @@ class TestAccountLockout:
         yield
         cache.clear()
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(autouse=True, scope="class")
     def _disable_throttling(self):
-        """Disable throttling for these tests."""
-        # Mock the throttle's allow_request method to always return True
-        with patch(
-            "backend.users.api.throttling.AuthEndpointThrottle.allow_request",
-            return_value=True,
-        ):
+        """Disable throttling once for the whole class."""
+        with patch.object(AuthEndpointThrottle, "allow_request", return_value=True):
             yield
 
     @pytest.fixture
@@ -61,7 +70,7 @@ class TestAccountLockout:
         for i in range(9):
             response = api_client.post(
                 url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
+                WRONG_LOGIN,
                 format="json",
             )
             assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -85,7 +94,7 @@ class TestAccountLockout:
         for i in range(10):
             response = api_client.post(
                 url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
+                WRONG_LOGIN,
                 format="json",
             )
             if i < 9:
@@ -97,7 +106,7 @@ class TestAccountLockout:
         # Next attempt should return 423 Locked
         response = api_client.post(
             url,
-            {"email": "lockout@example.com", "password": "wrongpassword"},
+            WRONG_LOGIN,
             format="json",
         )
         assert response.status_code == status.HTTP_423_LOCKED
@@ -113,12 +122,7 @@ class TestAccountLockout:
         url = reverse("api:auth-login")
 
         # Lock the account by making 10 failed attempts
-        for i in range(10):
-            api_client.post(
-                url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
-                format="json",
-            )
+        lock_account("lockout@example.com")
 
         # Try to login with CORRECT password - should be locked
         response = api_client.post(
@@ -137,7 +141,7 @@ class TestAccountLockout:
         for i in range(5):
             response = api_client.post(
                 url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
+                WRONG_LOGIN,
                 format="json",
             )
             assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -158,6 +162,20 @@ class TestAccountLockout:
         attempts = AccountLockoutService.get_attempt_count("lockout@example.com")
         assert attempts == 0
 
+    def test_clean_login_skips_reset(self, api_client, test_user):
+        """Test a login with no recorded failures does not clear lockout keys."""
+        url = reverse("api:auth-login")
+
+        with patch.object(AccountLockoutService, "reset_attempts") as mock_reset:
+            response = api_client.post(
+                url,
+                {"email": "lockout@example.com", "password": "TestPass123"},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_reset.assert_not_called()
+
     def test_different_users_tracked_independently(self, api_client):
         """Test that different users have independent lockout tracking."""
         # Create two users
@@ -175,12 +193,7 @@ class TestAccountLockout:
         url = reverse("api:auth-login")
 
         # Make 10 failed attempts for user1 (should lock)
-        for i in range(10):
-            api_client.post(
-                url,
-                {"email": "user1@example.com", "password": "wrongpassword"},
-                format="json",
-            )
+        lock_account("user1@example.com")
 
         # user1 should be locked
         response = api_client.post(
@@ -206,18 +219,18 @@ class TestAccountLockout:
         for i in range(5):
             api_client.post(
                 url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
+                WRONG_LOGIN,
                 format="json",
-                HTTP_X_FORWARDED_FOR="192.168.1.1",
+                **IP1_HEADERS,
             )
 
         # Make 5 more failed attempts from IP 2 (total 10)
         for i in range(5):
             api_client.post(
                 url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
+                WRONG_LOGIN,
                 format="json",
-                HTTP_X_FORWARDED_FOR="192.168.1.2",
+                **IP2_HEADERS,
             )
 
         # Account should now be locked regardless of IP
@@ -225,105 +238,45 @@ class TestAccountLockout:
             url,
             {"email": "lockout@example.com", "password": "TestPass123"},
             format="json",
-            HTTP_X_FORWARDED_FOR="192.168.1.3",
+            **IP3_HEADERS,
         )
         assert response.status_code == status.HTTP_423_LOCKED
 
-    def test_lockout_service_record_failed_attempt(self):
-        """Test AccountLockoutService.record_failed_attempt()."""
-        email = "test@example.com"
-
-        # Record 9 attempts - should not lock
-        for i in range(9):
-            locked = AccountLockoutService.record_failed_attempt(
-                email,
-                "192.168.1.1",
-            )
-            assert locked is False
-
-        # 10th attempt should lock
-        locked = AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
-        assert locked is True
-
-        # Verify lockout status
-        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
-        assert is_locked is True
-        assert seconds_remaining > 0
-
-    def test_lockout_service_is_locked(self):
-        """Test AccountLockoutService.is_locked()."""
-        email = "test@example.com"
-
-        # Account not locked initially
-        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
-        assert is_locked is False
-        assert seconds_remaining == 0
-
-        # Lock the account
-        for i in range(10):
-            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
-
-        # Account should be locked
-        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
-        assert is_locked is True
-        assert seconds_remaining > 0
-        assert seconds_remaining <= 3600  # Max 1 hour
-
-    def test_lockout_service_reset_attempts(self):
-        """Test AccountLockoutService.reset_attempts()."""
-        email = "test@example.com"
-
-        # Record some failed attempts
-        for i in range(5):
-            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
-
-        # Verify attempts recorded
-        attempts = AccountLockoutService.get_attempt_count(email)
-        assert attempts == 5
-
-        # Reset attempts
-        AccountLockoutService.reset_attempts(email)
-
-        # Attempts should be 0
-        attempts = AccountLockoutService.get_attempt_count(email)
-        assert attempts == 0
-
-        # Lockout should be cleared
-        is_locked, _ = AccountLockoutService.is_locked(email)
-        assert is_locked is False
-
-    def test_lockout_service_get_attempt_count(self):
-        """Test AccountLockoutService.get_attempt_count()."""
-        email = "test@example.com"
+    def test_malformed_email_skips_cache(self, api_client):
+        """Test missing or malformed emails are rejected without cache lookups."""
+        url = reverse("api:auth-login")
 
-        # Initial count should be 0
-        attempts = AccountLockoutService.get_attempt_count(email)
-        assert attempts == 0
+        with (
+            patch(
+                "backend.users.services.account_lockout.cache",
+                wraps=cache,
+            ) as mock_cache,
+            patch(
+                "backend.users.services.account_lockout.get_redis_client",
+            ) as mock_get_redis_client,
+        ):
+            for email in ["", "not-an-email", 42]:
+                response = api_client.post(
+                    url,
+                    {"email": email, "password": "wrongpassword"},
+                    format="json",
+                )
+                assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-        # Record 3 attempts
-        for i in range(3):
-            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
-
-        # Count should be 3
-        attempts = AccountLockoutService.get_attempt_count(email)
-        assert attempts == 3
+        assert mock_cache.method_calls == []
+        mock_get_redis_client.assert_not_called()
 
     def test_lockout_message_includes_retry_time(self, api_client, test_user):
         """Test that lockout response includes retry_after in minutes."""
         url = reverse("api:auth-login")
 
         # Lock the account
-        for i in range(10):
-            api_client.post(
-                url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
-                format="json",
-            )
+        lock_account("lockout@example.com")
 
         # Next attempt should return lockout message
         response = api_client.post(
             url,
-            {"email": "lockout@example.com", "password": "wrongpassword"},
+            WRONG_LOGIN,
             format="json",
         )
         assert response.status_code == status.HTTP_423_LOCKED
@@ -347,7 +300,7 @@ class TestAccountLockout:
         for i in range(5):
             api_client.post(
                 url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
+                WRONG_LOGIN,
                 format="json",
             )
 
@@ -394,17 +347,12 @@ class TestAccountLockout:
         url = reverse("api:auth-login")
 
         # Lock the account
-        for i in range(10):
-            api_client.post(
-                url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
-                format="json",
-            )
+        lock_account("lockout@example.com")
 
         # Get initial retry_after
         response = api_client.post(
             url,
-            {"email": "lockout@example.com", "password": "wrongpassword"},
+            WRONG_LOGIN,
             format="json",
         )
         assert response.status_code == status.HTTP_423_LOCKED
@@ -416,7 +364,7 @@ class TestAccountLockout:
         # Get new retry_after
         response = api_client.post(
             url,
-            {"email": "lockout@example.com", "password": "wrongpassword"},
+            WRONG_LOGIN,
             format="json",
         )
         assert response.status_code == status.HTTP_423_LOCKED
@@ -432,12 +380,7 @@ class TestAccountLockout:
         url = reverse("api:auth-login")
 
         # Lock the account
-        for i in range(10):
-            api_client.post(
-                url,
-                {"email": "lockout@example.com", "password": "wrongpassword"},
-                format="json",
-            )
+        lock_account("lockout@example.com")
 
         # Verify locked
         response = api_client.post(
@@ -519,3 +462,163 @@ class TestAccountLockout:
         ttl = cache.ttl(lockout_key)
         assert ttl is not None
         assert ttl <= LOCKOUT_DURATION
+
+
+class TestAccountLockoutService:
+    """Test AccountLockoutService directly; these tests never touch the database."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Clear cache before each test."""
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_lockout_service_record_failed_attempt(self):
+        """Test AccountLockoutService.record_failed_attempt()."""
+        email = "test@example.com"
+
+        # Record 9 attempts - should not lock
+        for i in range(9):
+            locked = AccountLockoutService.record_failed_attempt(
+                email,
+                "192.168.1.1",
+            )
+            assert locked is False
+
+        # 10th attempt should lock
+        locked = AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+        assert locked is True
+
+        # Verify lockout status
+        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
+        assert is_locked is True
+        assert seconds_remaining > 0
+
+    def test_lockout_service_is_locked(self):
+        """Test AccountLockoutService.is_locked()."""
+        email = "test@example.com"
+
+        # Account not locked initially
+        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
+        assert is_locked is False
+        assert seconds_remaining == 0
+
+        # Lock the account
+        for i in range(10):
+            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
+        # Account should be locked
+        is_locked, seconds_remaining = AccountLockoutService.is_locked(email)
+        assert is_locked is True
+        assert seconds_remaining > 0
+        assert seconds_remaining <= 3600  # Max 1 hour
+
+    def test_lockout_service_reset_attempts(self):
+        """Test AccountLockoutService.reset_attempts()."""
+        email = "test@example.com"
+
+        # Record some failed attempts
+        for i in range(5):
+            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
+        # Verify attempts recorded
+        attempts = AccountLockoutService.get_attempt_count(email)
+        assert attempts == 5
+
+        # Reset attempts
+        AccountLockoutService.reset_attempts(email)
+
+        # Attempts should be 0
+        attempts = AccountLockoutService.get_attempt_count(email)
+        assert attempts == 0
+
+        # Lockout should be cleared
+        is_locked, _ = AccountLockoutService.is_locked(email)
+        assert is_locked is False
+
+    def test_lockout_service_get_attempt_count(self):
+        """Test AccountLockoutService.get_attempt_count()."""
+        email = "test@example.com"
+
+        # Initial count should be 0
+        attempts = AccountLockoutService.get_attempt_count(email)
+        assert attempts == 0
+
+        # Record 3 attempts
+        for i in range(3):
+            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
+        # Count should be 3
+        attempts = AccountLockoutService.get_attempt_count(email)
+        assert attempts == 3
+
+    def test_attempts_recorded_with_one_script_call_on_redis(self):
+        """Test Redis attempts are trimmed, added and counted in one round-trip."""
+        from unittest.mock import ANY
+        from unittest.mock import MagicMock
+
+        from backend.users.services.account_lockout import ATTEMPT_WINDOW
+        from backend.users.services.account_lockout import ROLLING_WINDOW_SCRIPT
+
+        email = "redis@example.com"
+        redis_client = MagicMock()
+        redis_client.eval.return_value = 3
+
+        with (
+            patch(
+                "backend.users.services.account_lockout.get_redis_client",
+                return_value=redis_client,
+            ),
+            patch("time.time", return_value=1_000.5),
+        ):
+            locked = AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
+        assert locked is False
+        redis_client.eval.assert_called_once_with(
+            ROLLING_WINDOW_SCRIPT,
+            1,
+            cache.make_key(AccountLockoutService._get_attempt_key(email)),
+            1_000_500,
+            ATTEMPT_WINDOW * 1000,
+            ANY,
+        )
+
+    def test_lockout_state_read_in_one_pipeline_on_redis(self):
+        """Test Redis lockout checks see the attempt log despite its type."""
+        from unittest.mock import MagicMock
+
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value.execute.return_value = [None, 1]
+
+        with patch(
+            "backend.users.services.account_lockout.get_redis_client",
+            return_value=redis_client,
+        ):
+            state = AccountLockoutService.check_lockout("redis@example.com")
+
+        assert state == (False, 0, True)
+        redis_client.pipeline.return_value.execute.assert_called_once_with()
+
+    def test_attempt_older_than_window_not_counted(self):
+        """Test the window rolls: an attempt 61 minutes old no longer counts."""
+        import time
+
+        email = "window@example.com"
+        start = time.time()
+
+        with patch("time.time", return_value=start):
+            AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
+        with patch("time.time", return_value=start + 30 * 60):
+            for i in range(8):
+                AccountLockoutService.record_failed_attempt(email, "192.168.1.1")
+
+        # Would be the 10th attempt, but the first one has left the window
+        with patch("time.time", return_value=start + 61 * 60):
+            locked = AccountLockoutService.record_failed_attempt(
+                email,
+                "192.168.1.1",
+            )
+            assert locked is False
+            assert AccountLockoutService.get_attempt_count(email) == 9
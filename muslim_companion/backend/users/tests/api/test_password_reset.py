@@ -4,6 +4,8 @@ Tests for password reset functionality - end-to-end flow.
 Tests the complete password reset flow from request to confirmation.
 """
 
+from unittest.mock import patch
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
@@ -13,6 +15,8 @@ from django.utils.http import urlsafe_base64_encode
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from backend.users.api.throttling import AuthEndpointThrottle
+
 User = get_user_model()
 
 
@@ -20,16 +24,10 @@ User = get_user_model()
 class TestPasswordResetFlow:
     """Test complete password reset flow end-to-end."""
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(autouse=True, scope="class")
     def _disable_throttling(self):
-        """Disable throttling for these tests."""
-        from unittest.mock import patch
-
-        # Mock the throttle's allow_request method to always return True
-        with patch(
-            "backend.users.api.throttling.AuthEndpointThrottle.allow_request",
-            return_value=True,
-        ):
+        """Disable throttling once for the whole class."""
+        with patch.object(AuthEndpointThrottle, "allow_request", return_value=True):
             yield
 
     @pytest.fixture
@@ -45,6 +43,14 @@ class TestPasswordResetFlow:
             password="OldPass123",  # noqa: S106
         )
 
+    @pytest.fixture
+    def reset_credentials(self, test_user):
+        """Reset link parameters for test_user, generated once per test."""
+        return {
+            "uid": urlsafe_base64_encode(force_bytes(test_user.pk)),
+            "token": default_token_generator.make_token(test_user),
+        }
+
     def test_password_reset_request_with_valid_email(self, api_client, test_user):
         """Test password reset request with valid email returns 200."""
         url = reverse("api:auth-password-reset")
@@ -79,16 +85,16 @@ class TestPasswordResetFlow:
 
         assert response.status_code == status.HTTP_200_OK
 
-    def test_password_reset_confirm_with_valid_token(self, api_client, test_user):
+    def test_password_reset_confirm_with_valid_token(
+        self,
+        api_client,
+        test_user,
+        reset_credentials,
+    ):
         """Test password reset confirmation with valid token successfully resets password."""
-        # Generate valid reset token
-        token = default_token_generator.make_token(test_user)
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
-
         url = reverse("api:auth-password-reset-confirm")
         data = {
-            "uid": uid,
-            "token": token,
+            **reset_credentials,
             "new_password": "NewSecurePass123",
             "new_password_confirm": "NewSecurePass123",
         }
@@ -103,13 +109,16 @@ class TestPasswordResetFlow:
         assert test_user.check_password("NewSecurePass123")
         assert not test_user.check_password("OldPass123")
 
-    def test_password_reset_confirm_with_invalid_token(self, api_client, test_user):
+    def test_password_reset_confirm_with_invalid_token(
+        self,
+        api_client,
+        test_user,
+        reset_credentials,
+    ):
         """Test password reset confirmation with invalid token returns 400."""
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
-
         url = reverse("api:auth-password-reset-confirm")
         data = {
-            "uid": uid,
+            **reset_credentials,
             "token": "invalid-token",
             "new_password": "NewSecurePass123",
             "new_password_confirm": "NewSecurePass123",
@@ -124,14 +133,16 @@ class TestPasswordResetFlow:
         test_user.refresh_from_db()
         assert test_user.check_password("OldPass123")
 
-    def test_password_reset_confirm_with_invalid_uid(self, api_client, test_user):
+    def test_password_reset_confirm_with_invalid_uid(
+        self,
+        api_client,
+        reset_credentials,
+    ):
         """Test password reset confirmation with invalid UID returns 400."""
-        token = default_token_generator.make_token(test_user)
-
         url = reverse("api:auth-password-reset-confirm")
         data = {
+            **reset_credentials,
             "uid": "invalid-uid",
-            "token": token,
             "new_password": "NewSecurePass123",
             "new_password_confirm": "NewSecurePass123",
         }
@@ -143,16 +154,12 @@ class TestPasswordResetFlow:
     def test_password_reset_confirm_with_mismatched_passwords(
         self,
         api_client,
-        test_user,
+        reset_credentials,
     ):
         """Test password reset with mismatched passwords returns 400."""
-        token = default_token_generator.make_token(test_user)
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
-
         url = reverse("api:auth-password-reset-confirm")
         data = {
-            "uid": uid,
-            "token": token,
+            **reset_credentials,
             "new_password": "NewSecurePass123",
             "new_password_confirm": "DifferentPass123",
         }
@@ -162,15 +169,15 @@ class TestPasswordResetFlow:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "new_password_confirm" in response.data
 
-    def test_password_reset_confirm_with_weak_password(self, api_client, test_user):
+    def test_password_reset_confirm_with_weak_password(
+        self,
+        api_client,
+        reset_credentials,
+    ):
         """Test password reset with weak password returns 400."""
-        token = default_token_generator.make_token(test_user)
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
-
         url = reverse("api:auth-password-reset-confirm")
         data = {
-            "uid": uid,
-            "token": token,
+            **reset_credentials,
             "new_password": "weak",  # Too short, no uppercase, no digit
             "new_password_confirm": "weak",
         }
@@ -180,15 +187,11 @@ class TestPasswordResetFlow:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "new_password" in response.data
 
-    def test_password_reset_token_single_use(self, api_client, test_user):
+    def test_password_reset_token_single_use(self, api_client, reset_credentials):
         """Test that password reset token can only be used once."""
-        token = default_token_generator.make_token(test_user)
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
-
         url = reverse("api:auth-password-reset-confirm")
         data = {
-            "uid": uid,
-            "token": token,
+            **reset_credentials,
             "new_password": "NewSecurePass123",
             "new_password_confirm": "NewSecurePass123",
         }
@@ -203,7 +206,7 @@ class TestPasswordResetFlow:
         response = api_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_password_reset_complete_flow(self, api_client, test_user):
+    def test_password_reset_complete_flow(self, api_client, reset_credentials):
         """Test complete password reset flow: request -> confirm -> login."""
         # Step 1: Request password reset
         reset_url = reverse("api:auth-password-reset")
@@ -215,15 +218,11 @@ class TestPasswordResetFlow:
         assert response.status_code == status.HTTP_200_OK
 
         # Step 2: Confirm password reset (simulate receiving email)
-        token = default_token_generator.make_token(test_user)
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
-
         confirm_url = reverse("api:auth-password-reset-confirm")
         response = api_client.post(
             confirm_url,
             {
-                "uid": uid,
-                "token": token,
+                **reset_credentials,
                 "new_password": "NewSecurePass123",
                 "new_password_confirm": "NewSecurePass123",
             },
@@ -251,53 +250,35 @@ class TestPasswordResetFlow:
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_password_reset_enforces_password_strength(self, api_client, test_user):
+    @pytest.mark.parametrize(
+        "weak_password",
+        [
+            pytest.param("lowercase123", id="no-uppercase"),
+            pytest.param("UPPERCASE123", id="no-lowercase"),
+            pytest.param("NoDigitsHere", id="no-digit"),
+        ],
+    )
+    def test_password_reset_enforces_password_strength(
+        self,
+        api_client,
+        test_user,
+        reset_credentials,
+        weak_password,
+    ):
         """Test that password reset enforces same strength requirements as registration."""
-        token = default_token_generator.make_token(test_user)
-        uid = urlsafe_base64_encode(force_bytes(test_user.pk))
         url = reverse("api:auth-password-reset-confirm")
 
-        # Test: No uppercase
         response = api_client.post(
             url,
             {
-                "uid": uid,
-                "token": token,
-                "new_password": "lowercase123",
-                "new_password_confirm": "lowercase123",
+                **reset_credentials,
+                "new_password": weak_password,
+                "new_password_confirm": weak_password,
             },
             format="json",
         )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        # Refresh token after failed attempt
-        token = default_token_generator.make_token(test_user)
 
-        # Test: No lowercase
-        response = api_client.post(
-            url,
-            {
-                "uid": uid,
-                "token": token,
-                "new_password": "UPPERCASE123",
-                "new_password_confirm": "UPPERCASE123",
-            },
-            format="json",
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        # Refresh token after failed attempt
-        token = default_token_generator.make_token(test_user)
-
-        # Test: No digit
-        response = api_client.post(
-            url,
-            {
-                "uid": uid,
-                "token": token,
-                "new_password": "NoDigitsHere",
-                "new_password_confirm": "NoDigitsHere",
-            },
-            format="json",
-        )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "new_password" in response.data
+        test_user.refresh_from_db()
+        assert test_user.check_password("OldPass123")
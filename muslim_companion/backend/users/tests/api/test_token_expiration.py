@@ -16,6 +16,8 @@ from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from backend.users.api.throttling import AuthEndpointThrottle
+
 User = get_user_model()
 
 
@@ -23,16 +25,10 @@ User = get_user_model()
 class TestTokenExpiration:
     """Test JWT token expiration and refresh behavior."""
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(autouse=True, scope="class")
     def _disable_throttling(self):
-        """Disable throttling for these tests."""
-        from unittest.mock import patch
-
-        # Mock the throttle's allow_request method to always return True
-        with patch(
-            "backend.users.api.throttling.AuthEndpointThrottle.allow_request",
-            return_value=True,
-        ):
+        """Disable throttling once for the whole class."""
+        with patch.object(AuthEndpointThrottle, "allow_request", return_value=True):
             yield
 
     @pytest.fixture
@@ -96,6 +92,17 @@ class TestTokenExpiration:
         response = api_client.get(me_url)
         assert response.status_code == status.HTTP_200_OK
 
+    def test_refresh_token_accepted_form_encoded(self, api_client, test_user):
+        """Test refresh_token is accepted from immutable form-encoded data."""
+        refresh_token = str(RefreshToken.for_user(test_user))
+
+        url = reverse("api:auth-token-refresh")
+        response = api_client.post(url, {"refresh_token": refresh_token})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "access_token" in response.data
+        assert "access" not in response.data
+
     def test_expired_refresh_token_returns_401(self, api_client, test_user):
         """Test that expired refresh token returns 401."""
         # Create a refresh token with very short lifetime
@@ -4,6 +4,8 @@ from rest_framework import status
 from rest_framework.test import APIClient
 from rest_framework.test import APIRequestFactory
 
+from backend.users.api.serializers import UserProfileSerializer
+from backend.users.api.views import UserProfileViewSet
 from backend.users.api.views import UserViewSet
 from backend.users.models import User
 from backend.users.models import UserProfile
@@ -39,6 +41,26 @@ class TestUserViewSet:
         }
 
 
+@pytest.mark.django_db
+class TestUserProfileViewSet:
+    def test_profile_serialized_without_refetching_user(
+        self,
+        user: User,
+        django_assert_num_queries,
+    ):
+        UserProfile.objects.get_or_create(user=user)
+        request = APIRequestFactory().get("/fake-url/")
+        request.user = User.objects.get(pk=user.pk)
+        view = UserProfileViewSet()
+        view.request = request
+
+        # One query for the profile, none for profile.user
+        with django_assert_num_queries(1):
+            data = UserProfileSerializer(view.get_object()).data
+
+        assert data["is_analytics_enabled"] == user.is_analytics_enabled
+
+
 @pytest.mark.django_db
 class TestUserRegistrationView:
     """Test cases for user registration endpoint (AC #1, #6, #13, #14, #15)."""
@@ -102,6 +124,21 @@ class TestUserRegistrationView:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "email" in response.data
 
+    def test_register_with_email_differing_in_case_returns_400(self, api_client):
+        """Test registration rejects an existing email in another letter case."""
+        User.objects.create_user(username="casey", email="casey@example.com")
+        url = reverse("api:auth-register")
+        data = {
+            "email": "Casey@Example.com",
+            "password": "TestPass123",
+            "password_confirm": "TestPass123",
+        }
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "email" in response.data
+
     def test_register_with_weak_password_returns_400(self, api_client):
         """Test registration with weak password returns 400 (AC #6)."""
         url = reverse("api:auth-register")
@@ -176,6 +213,40 @@ class TestUserRegistrationView:
         # UUID will be in the format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
         assert len(str(user.id)) == 36
 
+    def test_register_picks_next_free_username_suffix(self, api_client):
+        """Test username collisions resolve to the first unused numeric suffix."""
+        User.objects.create_user(username="taken", email="taken@one.com")
+        User.objects.create_user(username="taken1", email="taken@two.com")
+        url = reverse("api:auth-register")
+        data = {
+            "email": "taken@example.com",
+            "password": "TestPass123",
+            "password_confirm": "TestPass123",
+        }
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert User.objects.get(email="taken@example.com").username == "taken2"
+
+    def test_register_ignores_usernames_only_sharing_the_prefix(self, api_client):
+        """Test only base or base<digits> usernames count as collisions."""
+        User.objects.create_user(username="first.lastname", email="fl@one.com")
+        User.objects.create_user(username="firstxlast", email="fl@two.com")
+        url = reverse("api:auth-register")
+        data = {
+            "email": "first.last@example.com",
+            "password": "TestPass123",
+            "password_confirm": "TestPass123",
+        }
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert User.objects.get(email="first.last@example.com").username == (
+            "first.last"
+        )
+
 
 @pytest.mark.django_db
 class TestUserLoginView:
@@ -2,6 +2,7 @@ import pytest
 from celery.result import EagerResult
 
 from backend.users.tasks import get_users_count
+from backend.users.tasks import send_password_reset_email
 from backend.users.tests.factories import UserFactory
 
 pytestmark = pytest.mark.django_db
@@ -15,3 +16,21 @@ def test_user_count(settings):
     task_result = get_users_count.delay()
     assert isinstance(task_result, EagerResult)
     assert task_result.result == batch_size
+
+
+def test_password_reset_email_plain_text_has_link_and_email(mailoutbox):
+    """The plain-text part carries the per-user values of the cached skeleton."""
+    send_password_reset_email.apply(
+        kwargs={
+            "user_email": "reset@example.com",
+            "reset_url": "https://example.com/reset-password",
+            "uid": "abc",
+            "token": "xyz",
+        },
+    )
+
+    assert len(mailoutbox) == 1
+    body = mailoutbox[0].body
+    assert "https://example.com/reset-password?uid=abc&token=xyz" in body
+    assert "reset@example.com" in body
+    assert "__RESET_LINK__" not in body
@@ -50,6 +50,19 @@ LOCALE_PATHS = [str(BASE_DIR / "locale")]
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Dedicated alias for health checks: not pooled, short connect and statement
+# timeouts, so probes don't queue behind application queries (US-API-007)
+DATABASES["health"] = {
+    **DATABASES["default"],
+    "ATOMIC_REQUESTS": False,
+    "CONN_MAX_AGE": 0,
+    "OPTIONS": {
+        **DATABASES["default"].get("OPTIONS", {}),
+        "connect_timeout": 1,
+        "options": "-c statement_timeout=500",
+    },
+    "TEST": {"MIRROR": "default"},
+}
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
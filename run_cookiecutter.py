@@ -3,6 +3,8 @@
 Script to run cookiecutter-django with specified configuration
 """
 
+import sys
+
 from cookiecutter.main import cookiecutter
 
 # Configuration matching the architecture document specifications
@@ -36,10 +38,11 @@ extra_context = {
 }
 
 # Run cookiecutter with the configuration
-print("Running cookiecutter-django with configuration:")
-for key, value in extra_context.items():
-    print(f"  {key}: {value}")
-print()
+sys.stdout.write(
+    "Running cookiecutter-django with configuration:\n"
+    + "".join(f"  {key}: {value}\n" for key, value in extra_context.items())
+    + "\n",
+)
 
 cookiecutter(
     "https://github.com/cookiecutter/cookiecutter-django",